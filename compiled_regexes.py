@@ -1,11 +1,44 @@
 # https://github.com/pyautoml/GmailPy
 
-import re
+"""
+This module stores precompiled regexes.
+
+Link patterns stop at whitespace, angle brackets, quotes and closing parentheses, so a link
+embedded in HTML markup never swallows the surrounding attribute or tag text:
+    >>> DETAILED_LINK.findall('<a href="https://a.io/x">https://b.io</a>')
+    ['https://a.io/x', 'https://b.io']
+"""
 
-"""This module stores precompiled regexes."""
+import re
 
 # find email addresses in a string
 BASIC_LINK = re.compile(r"https?://[^/]+")
-DETAILED_LINK = re.compile(r"https?://[^\s]+")
+DETAILED_LINK = re.compile(r'https?://[^\s<>"\'\)]+')
 EMAIL_ADDRESS = re.compile(r"[\w\.-]+@[\w\.-]+")
-HTTP_HTTPS_URL = re.compile(r"(?:https?://|www\.)\S+")
\ No newline at end of file
+HTTP_HTTPS_URL = re.compile(r'(?:https?://|www\.)[^\s<>"\'\)]+')
+
+# cheap pre-filter for a single address, used with fullmatch() before email_validator: dot-separated local part
+# without spaces or specials, '@', dotted domain whose labels start and end with a letter or digit (unicode allowed)
+VALID_EMAIL = re.compile(
+    r'[^\s@."(),:;<>\[\\\]]+(?:\.[^\s@."(),:;<>\[\\\]]+)*'
+    r'@(?:[^\W_](?:[^\s@.]*[^\W_])?\.)+[^\W_](?:[^\s@.]*[^\W_])?'
+)
+
+# one scan for both link flavours: 'detailed' is the full link, 'basic' is its domain prefix
+COMBINED_LINK = re.compile(r'(?P<detailed>(?P<basic>https?://[^/\s<>"\'\)]+)[^\s<>"\'\)]*)')
+
+# message cleanup (see utils.clean_message): characters other than letters, digits, whitespace and Latin-1/Extended-A letters,
+# plus no-break spaces, are dropped; runs of 2+ line breaks are collapsed; invisible unicode spaces are dropped
+NON_TEXT_CHARS = re.compile(r"(?:[^\w\s\u00C0-\u017F]|\xa0)+")
+LINE_BREAK_RUN = re.compile(r"(\r\n|\n|\r){2,}")
+INVISIBLE_SPACES = re.compile(r"[\u2000-\u200F\u2028\u2029\u202A-\u202F]")
+# NON_TEXT_CHARS and INVISIBLE_SPACES in one class, so both are dropped in a single scan
+MESSAGE_NOISE = re.compile(r"(?:[^\w\s\u00C0-\u017F]|[\xa0\u2000-\u200F\u2028\u2029\u202A-\u202F])+")
+
+# fused text cleanup: links (dropped), runs of 2+ line breaks (collapsed) and invisible unicode spaces (dropped);
+# a line break run may span links, since removing them makes the surrounding breaks adjacent
+CLEAN_TEXT_AND_URL = re.compile(
+    r'(?P<url>(?:https?://|www\.)[^\s<>"\'\)]+)'
+    r'|(?P<newlines>[\r\n](?:(?:https?://|www\.)[^\s<>"\'\)]+)?(?:[\r\n](?:(?:https?://|www\.)[^\s<>"\'\)]+)?)+)'
+    r'|[\u2000-\u200F\u2028\u2029\u202A-\u202F]'
+)
@@ -0,0 +1,111 @@
+# https://github.com/pyautoml/GmailPy
+
+import threading
+from typing import Dict, List
+
+"""
+This module provides an optional Hyperscan backend for the link patterns stored in compiled_regexes.py.
+
+All patterns are compiled into a single block-mode database, so a text is scanned once for every pattern.
+Hyperscan reports a match for every end offset, so each pattern here also consumes the delimiter that ends
+the link: a link is then reported exactly once, at its longest end, which matches the re module semantics.
+
+The backend is used only when the optional 'hyperscan' package is installed (pip install private_gmail[fast]).
+Check HYPERSCAN_AVAILABLE before calling scan().
+
+EMAIL_ADDRESS is not part of the database: its Unicode-aware \w does not compile in Hyperscan together with
+start-of-match tracking, so email addresses keep using the re module.
+"""
+
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+
+HYPERSCAN_AVAILABLE = hyperscan is not None
+
+# expression ids, mirroring HTTP_HTTPS_URL and the 'detailed' group of COMBINED_LINK
+HTTP_HTTPS_URL_ID = 0
+LINK_ID = 1
+
+# characters that end a link: Python's \s (str.isspace) spelled out, since Hyperscan's Unicode \s differs,
+# followed by the markup delimiters used in compiled_regexes.py
+_DELIMITERS = rb'\t\n\x0b\x0c\r\x1c-\x1f \x{85}\x{a0}\x{1680}\x{2000}-\x{200a}\x{2028}\x{2029}\x{202f}\x{205f}\x{3000}<>"\')'
+
+# every pattern ends with one delimiter character, which is cut off again in scan()
+_PATTERNS: Dict[int, bytes] = {
+    HTTP_HTTPS_URL_ID: rb'(?:https?://|www\.)[^' + _DELIMITERS + rb']+[' + _DELIMITERS + rb']',
+    LINK_ID: rb'https?://[^/' + _DELIMITERS + rb']+[^' + _DELIMITERS + rb']*[' + _DELIMITERS + rb']',
+}
+
+# appended to every text, so a link at the very end is terminated as well
+_SENTINEL = b" "
+
+_DATABASE = None
+_local = threading.local()
+
+
+def _database():
+    """
+    Compiles the Hyperscan database on first use.
+
+    Returns:
+    hyperscan.Database: A block-mode database with all patterns from _PATTERNS.
+    """
+
+    global _DATABASE
+
+    if _DATABASE is None:
+        database = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+        database.compile(
+            expressions=list(_PATTERNS.values()),
+            ids=list(_PATTERNS),
+            elements=len(_PATTERNS),
+            flags=hyperscan.HS_FLAG_SOM_LEFTMOST | hyperscan.HS_FLAG_UTF8,
+        )
+        _DATABASE = database
+    return _DATABASE
+
+
+def _scratch():
+    """
+    Returns the scratch space of the current thread. Hyperscan scratch must not be shared between threads.
+
+    Returns:
+    hyperscan.Scratch: Scratch space bound to the compiled database.
+    """
+
+    scratch = getattr(_local, "scratch", None)
+    if scratch is None:
+        scratch = _local.scratch = hyperscan.Scratch(_database())
+    return scratch
+
+
+def scan(text: str) -> Dict[int, List[str]]:
+    """
+    Scans a text once for all patterns.
+
+    Parameters:
+    text (str): The text to be scanned.
+
+    Returns:
+    Dict[int, List[str]]: Matches for every expression id (HTTP_HTTPS_URL_ID, LINK_ID),
+                          in the order re.findall() would return them.
+
+    Raises:
+    UnicodeEncodeError: If the text cannot be encoded as UTF-8.
+    """
+
+    data = text.encode("utf-8") + _SENTINEL
+    matches: Dict[int, List[str]] = {expression_id: [] for expression_id in _PATTERNS}
+
+    def _on_match(expression_id: int, start: int, end: int, flags: int, context: None) -> None:
+        # step back over the (possibly multi-byte) delimiter to the end of the link
+        stop = end - 1
+        while data[stop] & 0xC0 == 0x80:
+            stop -= 1
+        matches[expression_id].append(data[start:stop].decode("utf-8"))
+
+    _database().scan(data, match_event_handler=_on_match, scratch=_scratch())
+    return matches
@@ -2,19 +2,30 @@
 
 from enum import Enum
 
-"""This module contains enumerations to be used across the whole project."""
+"""
+This module contains enumerations to be used across the whole project.
 
-class LabelType(Enum):
+All enumerations subclass str, so members compare equal to (and hash like) the strings they wrap
+and can be used directly as dict keys or in membership tests. Use .value when formatting a member into text.
+"""
+
+class LabelType(str, Enum):
+    """
+    Label visibility types.
+
+    HIDDE is a deprecated alias of HIDDEN, kept for backward compatibility.
+    """
 
     VISIBLE = "visible"
-    HIDDE = "hidden"
+    HIDDEN = "hidden"
+    HIDDE = HIDDEN  # deprecated alias
 
-class LinksType(Enum):
+class LinksType(str, Enum):
     NONE = "None"
     BASIC = "links_basic"
     DETAILED = "links_detailed"
 
-class AllowedAttachment(Enum):
+class AllowedAttachment(str, Enum):
     PNG = "png"
     JPG = "jpg"
     JPEG = "jpeg"
@@ -1,13 +1,15 @@
 import re
-import sys
-import base64
+import binascii
+import logging
+from functools import wraps
 from logging import Logger
-from bs4 import BeautifulSoup
-from typing import Any, Dict, List, Union
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
 from googleapiclient.errors import HttpError
+from selectolax.lexbor import LexborHTMLParser
 from .exceptions import non_empty_string, non_empty_dict
-from .utils import extract_email_address, clean_text, null_logger
-from .compiled_regexes import HTTP_HTTPS_URL, DETAILED_LINK, BASIC_LINK
+from .utils import clean_text_and_strip_urls, null_logger
+from .compiled_regexes import HTTP_HTTPS_URL, COMBINED_LINK, EMAIL_ADDRESS
+from .compiled_regexes_fast import HYPERSCAN_AVAILABLE, LINK_ID, scan
 
 
 """
@@ -15,7 +17,84 @@ This module provides functions for extracting different sections of an email mes
 The main functionalities of the module are outlined below:
 """
 
-def links_detailed(links: List[str], logger: Logger = null_logger()) -> List[str]:
+_NULL_LOGGER = null_logger()
+
+# maps the URL-safe base64 alphabet used by Gmail onto the standard one
+_URLSAFE_TRANS = bytes.maketrans(b"-_", b"+/")
+
+# MIME types of message parts that carry the readable message body
+_TEXT_MIMES = frozenset(("text/plain", "text/html"))
+
+
+def _check_str_list(links: Any, name: str, logger: Logger) -> None:
+    """
+    Verifies in a single pass that 'links' is a list of strings.
+
+    Parameters:
+    links (Any): The value to be checked.
+    name (str): The links flavour used in error messages, e.g. 'basic' or 'detailed'.
+
+    Returns:
+    None
+
+    Raises:
+    TypeError: If 'links' is not a list or any of its items is not a string.
+    """
+
+    # exact class check first, isinstance() only for list subclasses
+    if not ((links.__class__ is list or isinstance(links, list)) and all(type(link) is str for link in links)):
+        logger.exception(f"Invalid {name} links type. Expected list of str, got {type(links)}")
+        raise TypeError(f"Invalid {name} links type. Expected list of str, got {type(links)}")
+
+
+def _scan_links_re(links: List[str]) -> Tuple[set, set]:
+    """
+    Scans each string once and collects both unique domain links and unique full links.
+
+    Parameters:
+    links (List[str]): A list of strings where each string may contain multiple links.
+
+    Returns:
+    Tuple[set, set]: A tuple of (basic, detailed) sets of unique links.
+    """
+
+    basic, detailed = set(), set()
+    add_basic, add_detailed = basic.add, detailed.add
+
+    for link in links:
+        for match in COMBINED_LINK.finditer(link):
+            domain, full = match.group("basic", "detailed")
+            add_basic(domain)
+            add_detailed(full)
+    return basic, detailed
+
+
+def _scan_links_hyperscan(links: List[str]) -> Tuple[set, set]:
+    """
+    Hyperscan variant of _scan_links_re(). The strings are joined with a line break, which ends every link,
+    so the whole list is scanned in a single call.
+
+    Parameters:
+    links (List[str]): A list of strings where each string may contain multiple links.
+
+    Returns:
+    Tuple[set, set]: A tuple of (basic, detailed) sets of unique links.
+    """
+
+    basic, detailed = set(), set()
+    add_basic, add_detailed = basic.add, detailed.add
+
+    for full in scan("\n".join(links))[LINK_ID]:
+        add_detailed(full)
+        slash = full.find("/", full.index("://") + 3)
+        add_basic(full if slash == -1 else full[:slash])
+    return basic, detailed
+
+
+_scan_links = _scan_links_hyperscan if HYPERSCAN_AVAILABLE else _scan_links_re
+
+
+def links_detailed(links: List[str], logger: Logger = _NULL_LOGGER) -> List[str]:
     """
     Extracts unique URLs from a list of strings that may contain multiple links.
 
@@ -36,24 +115,14 @@ def links_detailed(links: List[str], logger: Logger = null_logger()) -> List[str
 
     logger.info("Preparing detailed links.")
 
-    if not isinstance(links, list):
-        logger.exception(f"Invalid detailed links type. Expected list of str, got {type(links)}")
-        raise TypeError(f"Detailed links must be a list of str, got {type(links)}")
-    
-    if not all(isinstance(link, str) for link in links):
-        logger.exception(f"Invalid detailed link type. Expected str, got {type(links)}")
-        raise TypeError(f"Invalid detailed link type. Expected str, got {type(links)}")
+    _check_str_list(links, "detailed", logger)
 
-    unique_links = set()
-
-    logger.debug(f"Found {len(links)} detailed link(s).")
+    logger.debug("Found %d detailed link(s).", len(links))
 
     try:
-        for link in links:
-            matches = DETAILED_LINK.findall(link)
-            unique_links.update(matches)
+        _, unique_links = _scan_links(links)
 
-        logger.debug(f"Unique detailed link(s): {len(unique_links)}")
+        logger.debug("Unique detailed link(s): %d", len(unique_links))
         return list(unique_links)
     
     except re.error as e:
@@ -61,7 +130,7 @@ def links_detailed(links: List[str], logger: Logger = null_logger()) -> List[str
         raise ValueError(f"Invalid regular expression pattern found in detailed link: {e}") from e
 
 
-def links_basic(links: List[str], logger: Logger = null_logger()) -> List[str]:
+def links_basic(links: List[str], logger: Logger = _NULL_LOGGER) -> List[str]:
     """
     Extracts unique domain links from a list of strings.
 
@@ -81,23 +150,14 @@ def links_basic(links: List[str], logger: Logger = null_logger()) -> List[str]:
     
     logger.info("Preparing basic links.")
 
-    if not isinstance(links, list):
-        logger.exception(f"Invalid basic links type. Expected list of str, got {type(links)}")
-        raise TypeError(f"Invalid basic links type. Expected list of str, got {type(links)}")
-    
-    if not all(isinstance(link, str) for link in links):
-        logger.exception(f"Invalid basic link type. Expected str, got {type(links)}")
-        raise TypeError(f"Invalid basic link type. Expected str, got {type(links)}")
-    
-    unique_domains = set()
-    logger.debug(f"Found {len(links)} basic link(s).")
+    _check_str_list(links, "basic", logger)
+
+    logger.debug("Found %d basic link(s).", len(links))
 
     try:
-        for link in links:
-            matches = BASIC_LINK.findall(link)
-            unique_domains.update(matches)
+        unique_domains, _ = _scan_links(links)
 
-        logger.debug(f"Unique basic link(s): {len(unique_domains)}")
+        logger.debug("Unique basic link(s): %d", len(unique_domains))
         return list(unique_domains)
 
     except re.error as e:
@@ -105,13 +165,19 @@ def links_basic(links: List[str], logger: Logger = null_logger()) -> List[str]:
         raise ValueError(f"Invalid regular expression pattern found in basic: {e}") from e
 
 
-def add_links(links: List[str], link_type: str, message_template: Dict, logger: Logger = null_logger()) -> Dict:
+_LINK_DISPATCH: Dict[str, Callable] = {
+    "links_basic": links_basic,
+    "links_detailed": links_detailed,
+}
+
+
+def add_links(links: List[str], link_type: str, message_template: Dict, logger: Logger = _NULL_LOGGER) -> Dict:
     """
     Includes links in the given message template based on the specified link type.
 
     Parameters:
     links (List[str]): A list of strings representing links.
-    link_type (str): The type of links to be included, either 'detailed' or 'selected'.
+    link_type (str): The type of links to be included, either 'links_basic' or 'links_detailed' (or LinksType.BASIC / LinksType.DETAILED).
     message_template (Dict): A dictionary representing the message template. Must contain 
                              a 'links' key with 'href' and 'number' keys.
 
@@ -120,22 +186,25 @@ def add_links(links: List[str], link_type: str, message_template: Dict, logger:
 
     Raises:
     TypeError: If 'links' is not a list of strings.
-    ValueError: If 'link_type' is not valid ('detailed' or 'selected').
+    ValueError: If 'link_type' is not valid ('links_basic' or 'links_detailed').
     EmailSectionKeyException: If required keys are missing in the message_template.
     EmailSectionUnexpectedException: If any other unexpected error occurs.
     """
     
     logger.debug("Adding links.")
 
-    try:
-        non_empty_string(link_type)
-        method = getattr(sys.modules[__name__], link_type, None)
+    non_empty_string(link_type)
+    method = _LINK_DISPATCH.get(link_type)
+
+    if method is None:
+        logger.exception(f"Invalid link type '{link_type}'. Expected one of: {', '.join(_LINK_DISPATCH)}")
+        raise ValueError(f"Invalid link type '{link_type}'. Expected one of: {', '.join(_LINK_DISPATCH)}")
 
-        if callable(method):
-            message_template["links"]["href"] = method(links, logger)
-            message_template["links"]["number"] = len(message_template["links"]["href"])
+    try:
+        message_template["links"]["href"] = method(links, logger)
+        message_template["links"]["number"] = len(message_template["links"]["href"])
 
-        logger.debug(f"Added {message_template['links']['number']} link(s)")
+        logger.debug("Added %d link(s)", message_template["links"]["number"])
         return message_template
     except KeyError as e:
         logger.exception(f"Missing key in message_template: {e}")
@@ -145,7 +214,7 @@ def add_links(links: List[str], link_type: str, message_template: Dict, logger:
         raise Exception(f"Unexpected exception while adding links: {e}") from e
     
 
-def get_headers(message: Dict, logger: Logger = null_logger()) -> Dict:
+def get_headers(message: Dict, logger: Logger = _NULL_LOGGER) -> Dict:
     """
     Retrieves headers from a given message dictionary.
 
@@ -169,10 +238,7 @@ def get_headers(message: Dict, logger: Logger = null_logger()) -> Dict:
         logger.exception(f"Message should be a dictionary, got {type(message)}")
         raise TypeError(f"Message should be a dictionary, got {type(message)}")
 
-    if 'payload' in message:
-        headers = message.get('payload', {}).get('headers', {})
-    else:
-        headers = message.get('headers', {})
+    headers = message.get('payload', message).get('headers', {})
 
     if not isinstance(headers, dict):
         logger.exception(f"'headers' key should be a dictionary, not '{type(headers)}'")
@@ -181,7 +247,53 @@ def get_headers(message: Dict, logger: Logger = null_logger()) -> Dict:
     return headers
 
 
-def get_labels(service, logger: Logger = null_logger()) -> list:
+# error type -> (log/raise message prefix, raised type); HttpError cannot be rebuilt from a message, so it is re-raised as is
+_API_ERRORS: Dict[type, Tuple[str, type]] = {
+    HttpError: ("HTTP error occurred while", HttpError),
+    TimeoutError: ("API call timed out while", TimeoutError),
+    KeyError: ("Missing key in API response while", KeyError),
+    TypeError: ("Invalid input while", TypeError),
+    ValueError: ("Invalid input while", ValueError),
+    Exception: ("An unexpected error occurred while", Exception),
+}
+
+
+def _gmail_api(action: str) -> Callable:
+    """
+    Decorator that logs and re-raises errors of a Gmail API function in one place.
+
+    Parameters:
+    action (str): What the wrapped function does, used in messages, e.g. 'creating visible label'.
+
+    Returns:
+    Callable: The decorator. The wrapped function logs to the Logger passed to it (or the null logger).
+
+    Raises:
+    HttpError: The original error, if the Gmail API call failed.
+    TimeoutError, KeyError, TypeError, ValueError, Exception: With a message naming the action.
+    """
+
+    def decorator(func: Callable) -> Callable:
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            try:
+                return func(*args, **kwargs)
+            except Exception as e:
+                error_type = next(cls for cls in type(e).__mro__ if cls in _API_ERRORS)
+                prefix, raise_type = _API_ERRORS[error_type]
+                logger = kwargs.get("logger") or next(
+                    (arg for arg in args if isinstance(arg, Logger)), _NULL_LOGGER
+                )
+                logger.exception(f"{prefix} {action}: {e}")
+                if raise_type is HttpError:
+                    raise
+                raise raise_type(f"{prefix} {action}: {e}") from e
+        return wrapper
+    return decorator
+
+
+@_gmail_api("getting labels")
+def get_labels(service, logger: Logger = _NULL_LOGGER) -> list:
     """
     Retrieves a list of labels associated with the user's account from the Gmail API.
 
@@ -198,25 +310,266 @@ def get_labels(service, logger: Logger = null_logger()) -> list:
 
     logger.debug("Collecting labels from Gmail account.")
 
-    try:
-        return service.users().labels().list(userId="me").execute().get("labels", [])
-    except TypeError as e:
-        logger.exception(f"Invalid input for 'label_name': {e}")
-        raise TypeError(f"Invalid input for 'label_name': {e}") from e
-    except HttpError as e:
-        logger.exception(f"HTTP error occurred while getting labels: {e}")
-        raise HttpError(f"HTTP error occurred while getting labels: {e}") from e
-    except TimeoutError as e:
-        logger.exception(f"API call timed out while getting labels: {e}")
-        raise TimeoutError(f"API call timed out while getting labels: {e}") from e
-    except KeyError as e:
-        logger.exception(f"Missing key in API response while getting labels: {e}")
-        raise KeyError(f"Missing key in API response while getting labels: {e}") from e
-    except Exception as e:
-        logger.exception(f"An unexpected error occurred while getting labels: {e}")
-        raise Exception(f"An unexpected error occurred while getting labels: {e}") from e
+    return service.users().labels().list(userId="me").execute().get("labels", [])
+
+# Gmail accepts at most 100 calls in a single batch request, but advises to send 50 or less to avoid rate limiting
+_BATCH_LIMIT = 50
+
+
+def _execute_batch(
+        requests: List[Any],
+        service: Any,
+        logger: Logger,
+        batch_limit: int = _BATCH_LIMIT,
+        raise_errors: bool = True,
+        on_response: Optional[Callable[[int, Any], None]] = None,
+        http: Optional[Any] = None
+    ) -> List[Any]:
+    """
+    Executes prepared Gmail API requests through the batch endpoint, sending at most
+    'batch_limit' requests per HTTP round-trip.
 
-def create_visible_label(label_name: str, service: Any, logger: Logger = null_logger()) -> Any:
+    Parameters:
+    requests (List[Any]): A list of prepared (not yet executed) Gmail API requests.
+    service (Any): An instance of the Gmail API service object. This object is used to make API calls.
+    batch_limit (int): The maximum number of requests sent in one batch. Defaults to _BATCH_LIMIT.
+    raise_errors (bool): If True, raise the first failure. If False, failed requests get None as their response.
+    on_response (Optional[Callable[[int, Any], None]]): Called with the index and response of every successful request
+                                                        as soon as its batch completes, also when other requests fail.
+    http (Optional[Any]): The authorized transport the batches are sent with. The transport of 'service' by default.
+
+    Returns:
+    List[Any]: The API responses, in the same order as 'requests'.
+
+    Raises:
+    HttpError: If any of the batched requests failed and 'raise_errors' is True. The first failure is raised.
+    """
+
+    responses: List[Any] = [None] * len(requests)
+    errors: List[Exception] = []
+
+    def _callback(request_id: str, response: Any, exception: Exception) -> None:
+        if exception is not None:
+            errors.append(exception)
+        else:
+            index = int(request_id)
+            responses[index] = response
+            if on_response is not None:
+                on_response(index, response)
+
+    for start in range(0, len(requests), batch_limit):
+        batch = service.new_batch_http_request(callback=_callback)
+        for index, request in enumerate(requests[start:start + batch_limit], start):
+            batch.add(request, request_id=str(index))
+        batch.execute(http=http)
+
+    if errors:
+        logger.error("%d of %d batched request(s) failed: %s", len(errors), len(requests), errors[0])
+        if raise_errors:
+            raise errors[0]
+    return responses
+
+
+def label_body(label_name: str, visible: bool = True) -> Dict:
+    """
+    Builds the label resource sent to the Gmail API when creating a label.
+
+    Parameters:
+    label_name (str): The name of the label.
+    visible (bool): If True, the label is shown in the label list and message list. If False, it is hidden. True by default.
+
+    Returns:
+    Dict: The label resource.
+    """
+
+    if visible:
+        return {"name": label_name, "labelListVisibility": "labelShow", "messageListVisibility": "show"}
+    return {"name": label_name, "labelListVisibility": "labelHide", "messageListVisibility": "hide"}
+
+
+def create_labels(
+        label_bodies: List[Dict],
+        service: Any,
+        logger: Logger = _NULL_LOGGER,
+        on_response: Optional[Callable[[int, Any], None]] = None
+    ) -> List[Any]:
+    """
+    Creates several labels in the user's Gmail account using batched API calls.
+
+    Parameters:
+    label_bodies (List[Dict]): A list of label resources (see label_body), each containing at least a non-empty 'name',
+                               e.g. {"name": "x", "labelListVisibility": "labelShow", "messageListVisibility": "show"}.
+    service (Any): An instance of the Gmail API service object. This object is used to make API calls.
+    on_response (Optional[Callable[[int, Any], None]]): Called with the index and resource of every created label,
+                                                        also when other requests of the batch fail.
+
+    Returns:
+    List[Any]: The created label resources, in the same order as 'label_bodies'.
+
+    Raises:
+    TypeError: If 'label_bodies' is not a list of dicts or a label name is not a string.
+    ValueError: If 'label_bodies' is empty or a label body or name is empty.
+    HttpError: If any of the batched requests failed.
+    """
+
+    logger.info("Creating labels.")
+
+    if not isinstance(label_bodies, list) or not label_bodies:
+        logger.exception(f"Label bodies must be a non-empty list of dicts, got {type(label_bodies)}")
+        raise ValueError(f"Label bodies must be a non-empty list of dicts, got {type(label_bodies)}")
+
+    for body in label_bodies:
+        non_empty_dict(body)
+        non_empty_string(body.get("name"))
+
+    labels = service.users().labels()
+    return _execute_batch(
+        [labels.create(userId="me", body=body) for body in label_bodies], service, logger, on_response=on_response
+    )
+
+
+def delete_labels(
+        label_ids: List[str],
+        service: Any,
+        logger: Logger = _NULL_LOGGER,
+        on_response: Optional[Callable[[int, Any], None]] = None
+    ) -> List[Any]:
+    """
+    Deletes several labels from the user's Gmail account using batched API calls.
+
+    Parameters:
+    label_ids (List[str]): A list of IDs of the labels to be deleted. Each must be a non-empty string.
+    service (Any): An instance of the Gmail API service object. This object is used to make API calls.
+    on_response (Optional[Callable[[int, Any], None]]): Called with the index and response of every deleted label,
+                                                        also when other requests of the batch fail.
+
+    Returns:
+    List[Any]: The API responses, in the same order as 'label_ids'.
+
+    Raises:
+    TypeError: If 'label_ids' is not a list of strings.
+    ValueError: If 'label_ids' is empty or contains an empty string.
+    HttpError: If any of the batched requests failed.
+    """
+
+    logger.info("Deleting labels.")
+
+    if not isinstance(label_ids, list) or not label_ids:
+        logger.exception(f"Label IDs must be a non-empty list of str, got {type(label_ids)}")
+        raise ValueError(f"Label IDs must be a non-empty list of str, got {type(label_ids)}")
+
+    for label_id in label_ids:
+        non_empty_string(label_id)
+
+    labels = service.users().labels()
+    return _execute_batch(
+        [labels.delete(userId="me", id=label_id) for label_id in label_ids], service, logger, on_response=on_response
+    )
+
+
+def download_attachments(
+        message_id: str,
+        attachment_ids: List[str],
+        service: Any,
+        logger: Logger = _NULL_LOGGER,
+        skip_failed: bool = False
+    ) -> List[Union[str, None]]:
+    """
+    Downloads several attachments of a Gmail message using batched API calls,
+    at most _BATCH_LIMIT attachments per HTTP round-trip.
+
+    Parameters:
+    message_id (str): The unique identifier of the Gmail message the attachments belong to.
+    attachment_ids (List[str]): A list of IDs of the attachments to be downloaded. Each must be a non-empty string.
+    service (Any): An instance of the Gmail API service object. This object is used to make API calls.
+    skip_failed (bool): If True, a failed download yields None instead of raising. False by default.
+
+    Returns:
+    List[Union[str, None]]: The base64url encoded attachment data, in the same order as 'attachment_ids'.
+                            None for an attachment without "data" (or a failed one, if 'skip_failed' is True).
+
+    Raises:
+    TypeError: If 'attachment_ids' is not a list of strings.
+    ValueError: If 'message_id' or an attachment ID is empty.
+    HttpError: If any of the batched requests failed and 'skip_failed' is False.
+    """
+
+    logger.debug("Downloading %d attachment(s).", len(attachment_ids) if isinstance(attachment_ids, list) else 0)
+    non_empty_string(message_id)
+
+    if not isinstance(attachment_ids, list):
+        logger.exception(f"Attachment IDs must be a list of str, got {type(attachment_ids)}")
+        raise TypeError(f"Attachment IDs must be a list of str, got {type(attachment_ids)}")
+
+    if not attachment_ids:
+        return []
+
+    # one pass over the IDs; non_empty_string only runs for the first invalid one to raise its error
+    invalid_ids = [attachment_id for attachment_id in attachment_ids if type(attachment_id) is not str or not attachment_id]
+    if invalid_ids:
+        non_empty_string(invalid_ids[0])
+
+    attachments = service.users().messages().attachments()
+    responses = _execute_batch(
+        [attachments.get(userId="me", messageId=message_id, id=attachment_id) for attachment_id in attachment_ids],
+        service,
+        logger,
+        raise_errors=not skip_failed,
+    )
+    return [response.get("data") if response else None for response in responses]
+
+
+def get_messages(
+        message_ids: List[str],
+        service: Any,
+        logger: Logger = _NULL_LOGGER,
+        format: str = "full",
+        http: Optional[Any] = None,
+        fields: Optional[str] = None
+    ) -> List[Dict]:
+    """
+    Fetches several Gmail messages using batched API calls, at most _BATCH_LIMIT messages
+    per HTTP round-trip, instead of one messages.get call per message.
+
+    Parameters:
+    message_ids (List[str]): A list of IDs of the messages to be fetched. Each must be a non-empty string.
+    service (Any): An instance of the Gmail API service object. This object is used to make API calls.
+    format (str): The format of the returned messages: "full", "metadata", "minimal" or "raw". "full" by default.
+    http (Optional[Any]): The authorized transport the batches are sent with, e.g. one per thread. The transport of 'service' by default.
+    fields (Optional[str]): A partial response selector, e.g. "id,payload(headers)". All fields are returned by default.
+
+    Returns:
+    List[Dict]: The message resources, in the same order as 'message_ids'.
+
+    Raises:
+    TypeError: If 'message_ids' is not a list of strings.
+    ValueError: If a message ID is empty.
+    HttpError: If any of the batched requests failed.
+    """
+
+    logger.info("Getting messages.")
+
+    if not isinstance(message_ids, list):
+        logger.exception(f"Message IDs must be a list of str, got {type(message_ids)}")
+        raise TypeError(f"Message IDs must be a list of str, got {type(message_ids)}")
+
+    if not message_ids:
+        return []
+
+    for message_id in message_ids:
+        non_empty_string(message_id)
+
+    messages = service.users().messages()
+    return _execute_batch(
+        [messages.get(userId="me", id=message_id, format=format, fields=fields) for message_id in message_ids],
+        service,
+        logger,
+        http=http,
+    )
+
+
+@_gmail_api("creating visible label")
+def create_visible_label(label_name: str, service: Any, logger: Logger = _NULL_LOGGER) -> Any:
     """
     Creates a visible label in the user's Gmail account.
     Gmail API exceptions are verified by gmail_api_exceptions wrapper.
@@ -240,33 +593,13 @@ def create_visible_label(label_name: str, service: Any, logger: Logger = null_lo
 
     logger.info("Creating visible label.")
 
-    try:
-        non_empty_string(label_name)
-
-        label_body = {
-            "name": label_name,
-            "labelListVisibility": "labelShow",
-            "messageListVisibility": "show",
-        }
-        return service.users().labels().create(userId="me", body=label_body).execute()    
-    except TypeError as e:
-        logger.exception(f"Invalid input for visible 'label_name': {e}") 
-        raise TypeError(f"Invalid input for visible 'label_name': {e}") from e
-    except HttpError as e:
-        logger.exception(f"HTTP error occurred while creating visible label: {e}")
-        raise HttpError(f"HTTP error occurred while creating visible label: {e}") from e
-    except TimeoutError as e:
-        logger.exception(f"API call timed out while creating visible label: {e}")
-        raise TimeoutError(f"API call timed out while creating visible label: {e}") from e
-    except KeyError as e:
-        logger.exception(f"Missing key in API response while creating visible label: {e}")
-        raise KeyError(f"Missing key in API response while creating visible label: {e}") from e
-    except Exception as e:
-        logger.exception(f"An unexpected error occurred while creating visible label: {e}") 
-        raise Exception(f"An unexpected error occurred while creating visible label: {e}") from e
+    non_empty_string(label_name)
 
+    return create_labels([label_body(label_name, visible=True)], service, logger)[0]
 
-def create_hidden_label(label_name: str, service: Any, logger: Logger = null_logger()) -> Any:
+
+@_gmail_api("creating hidden label")
+def create_hidden_label(label_name: str, service: Any, logger: Logger = _NULL_LOGGER) -> Any:
     """
     Creates a hidden label in the user's Gmail account.
     Gmail API exceptions are verified by gmail_api_exceptions wrapper.
@@ -290,33 +623,13 @@ def create_hidden_label(label_name: str, service: Any, logger: Logger = null_log
 
     logger.info("Creating hidden label.")
 
-    try:
-        non_empty_string(label_name)
-
-        label_body = {
-            "name": label_name,
-            "labelListVisibility": "labelHide",
-            "messageListVisibility": "hide",
-        }
-        return service.users().labels().create(userId="me", body=label_body).execute()
-    except TypeError as e:
-        logger.exception(f"Invalid input for hidden 'label_name': {e}")
-        raise TypeError(f"Invalid input for hidden 'label_name': {e}") from e
-    except HttpError as e:
-        logger.exception(f"HTTP error occurred while creating hidden label: {e}")
-        raise HttpError(f"HTTP error occurred while creating hidden label: {e}") from e
-    except TimeoutError as e:
-        logger.exception(f"HTTP error occurred while creating hidden label: {e}")
-        raise TimeoutError(f"HTTP error occurred while creating hidden label: {e}") from e
-    except KeyError as e:
-        logger.exception(f"Missing key in API response while creating hidden label: {e}")
-        raise KeyError(f"Missing key in API response while creating hidden label: {e}") from e
-    except Exception as e:
-        logger.exception(f"Unexpected error occurred while creating hidden label: {e}")
-        raise Exception(f"Unexpected error occurred while creating hidden label: {e}") from e
+    non_empty_string(label_name)
 
+    return create_labels([label_body(label_name, visible=False)], service, logger)[0]
 
-def delete_label(label_name: str, label_id: str, service: Any, logger: Logger = null_logger()) -> bool:
+
+@_gmail_api("deleting label")
+def delete_label(label_name: str, label_id: str, service: Any, logger: Logger = _NULL_LOGGER) -> bool:
     """
     Deletes a label from the user's Gmail account using the Gmail API.
     
@@ -347,25 +660,11 @@ def delete_label(label_name: str, label_id: str, service: Any, logger: Logger =
     non_empty_string(label_name)
     non_empty_string(label_id)
 
-    try:
-        response = service.users().labels().delete(userId="me", id=label_id).execute()
-        return response
-    
-    except HttpError as e:
-        logger.exception(f"HttpError. Failed to delete label '{label_name}'")
-        raise HttpError(f"Failed to delete label '{label_name}' (ID: {label_id}) due to an HTTP error: {e}") from e
-
-    except TimeoutError as e:
-        logger.exception(f"TimeoutError. Failed to delete label '{label_name}'")
-        raise TimeoutError(f"API call timed out while deleting label '{label_name}' (ID: {label_id}): {e}") from e
-
-    except Exception as e:
-        logger.exception(f"Unexpected exception. Failed to delete label '{label_name}'")
-        raise Exception(f"An unexpected error occurred while deleting label '{label_name}' (ID: {label_id}): {e}") from e
+    return delete_labels([label_id], service, logger)[0]
 
 
 def email_basic_information(
-    email_data: List[Dict[str, str]], message_template: Dict[str, Union[str, List[str]]], logger: Logger = null_logger()
+    email_data: List[Dict[str, str]], message_template: Dict[str, Union[str, List[str]]], logger: Logger = _NULL_LOGGER
 ) -> Dict[str, Union[str, List[str]]]:
     """
     This function extracts basic information from an email data dictionary and populates a message template dictionary.
@@ -378,9 +677,9 @@ def email_basic_information(
     Dict[str, Union[str, List[str]]]: The updated message template dictionary with 'from', 'to', and 'subject' fields populated from the email data.
 
     The function iterates through the email data and populates the 'from', 'to', and 'subject' fields in the message template based on the 'name' field.
-    If the 'name' field is 'From', the function extracts the email address using the 'extract_email_address' function and populates the 'from' field in the message template.
-    If the 'name' field is 'Subject', the function populates the 'subject' field in the message template.
-    If the 'name' field is 'To', the function extracts the email address using the 'extract_email_address' function and populates the 'to' field in the message template.
+    If the 'name' field is 'From', the function extracts the email addresses with the precompiled EMAIL_ADDRESS pattern and populates the 'from' field in the message template.
+    All 'Subject' headers are collected in a single pass and stored as a list in the 'subject' field.
+    If the 'name' field is 'To', the function extracts the email addresses with the precompiled EMAIL_ADDRESS pattern and populates the 'to' field in the message template.
 
     Raises:
     Exception:
@@ -389,19 +688,25 @@ def email_basic_information(
     logger.info("Collecting basic email data from headers.")
 
     try:
+        subjects: List[str] = []
+        find_addresses = EMAIL_ADDRESS.findall
+
         for values in email_data:
             name = values["name"]
             if name == "From":
-                message_template["from"] = extract_email_address(values["value"])
-                message_template["subject"] = [
-                    j["value"] for j in email_data if j["name"] == "Subject"
-                ]
-                logger.debug(f"message from: {message_template['from']}")
-                logger.debug(f"message subject: {message_template['subject']}")
-            if name == "To":
-                message_template["to"] = extract_email_address(values["value"])
-                logger.debug(f"message to: {message_template['to']}")
-                
+                message_template["from"] = find_addresses(values["value"])
+            elif name == "To":
+                message_template["to"] = find_addresses(values["value"])
+            elif name == "Subject":
+                subjects.append(values["value"])
+
+        message_template["subject"] = subjects
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("message from: %s", message_template.get("from"))
+            logger.debug("message subject: %s", message_template["subject"])
+            logger.debug("message to: %s", message_template.get("to"))
+
         return message_template
     except KeyError as e:
         logger.exception(f"Missing key while extracting basic email data: {e}")
@@ -413,23 +718,44 @@ def email_basic_information(
         raise Exception(f"Unexpected error while extracting basic email data: {e}")
 
 
+def _walk_text_parts(part: Dict) -> Iterator[Tuple[str, str]]:
+    """
+    Walks a message payload recursively, so text parts nested in e.g. 'multipart/alternative' are found as well.
+
+    Parameters:
+    part (Dict): A message payload or one of its (nested) parts.
+
+    Returns:
+    Iterator[Tuple[str, str]]: The MIME type and base64url body data of every text part holding data, in message order.
+    """
+
+    mime_type = part.get("mimeType")
+    if mime_type in _TEXT_MIMES:
+        data = part.get("body", {}).get("data")
+        if data:
+            yield mime_type, data
+
+    for child in part.get("parts", ()):
+        yield from _walk_text_parts(child)
+
+
 def email_message_from_partial(
-    message: dict, message_template: dict, logger: Logger = null_logger()) -> tuple:
+    message: dict, message_template: dict, logger: Logger = _NULL_LOGGER) -> tuple:
     """
     Extracts the message content and hidden links from a partial email message.
 
     Parameters:
     message (dict): A dictionary representing the email message. It should contain a 'payload' key,
-                    which is also a dictionary. The 'payload' dictionary should contain a 'parts' key,
-                    which is a list of dictionaries representing different parts of the email message.
+                    which is also a dictionary. The 'payload' is either a single text part or holds a 'parts'
+                    list of (possibly nested) dictionaries representing different parts of the email message.
     message_template (dict): A dictionary representing a template for the email message. It should contain
                              a 'message' key, which is a string to store the extracted message content.
     Returns:
     tuple: A tuple containing the updated message_template dictionary and the list of extracted links.
-           If the 'payload' or 'parts' key is not found in the 'message' dictionary, an empty tuple is returned.
+           If the 'payload' key is not found in the 'message' dictionary, ({}, []) is returned.
 
     Raises:
-    KeyError: If partial is missing 'body' or 'data' keys.
+    KeyError: If 'message_template' is missing the 'message' key. Parts without 'body' or 'data' are skipped.
     ValueError (from non_empty_dict()): If the input is not of dict type.
     TypeError (from non_empty_dict()): If the input dict is empty.
     """
@@ -443,28 +769,18 @@ def email_message_from_partial(
         logger.debug("No 'payload' in message keys. Returning None.")
         return ({},[])
 
-    if "parts" not in message["payload"].keys():
-        logger.debug("No 'parts' in message payload keys. Returning None.")
-        return ({},[])
+    for mime_type, data in _walk_text_parts(message["payload"]):
+        chunk = binascii.a2b_base64(data.encode("ascii").translate(_URLSAFE_TRANS)).decode("utf-8")
 
-    for part in message["payload"]["parts"]:
-        if "mimeType" not in part.keys():
-            logger.debug("No 'mimeType' in message payload part keys. Continue search.")
-            continue
+        if mime_type == "text/plain":
+            # plain text is used as it is: an HTML parser would read e.g. 'a<b' as the start of a tag and drop the rest;
+            # links are collected, removed and the message cleaned in a single pass
+            message = clean_text_and_strip_urls(chunk, links.append)
         else:
-            if part["mimeType"] in ["text/plain", "text/html"]:
-                try:
-                    chunk = base64.urlsafe_b64decode(part["body"]["data"]).decode("utf-8")
-                    soup = BeautifulSoup(chunk, "html.parser")
-
-                    for link in re.findall(HTTP_HTTPS_URL, chunk):
-                        links.append(link) # extract hidden links
-                    message = re.sub(HTTP_HTTPS_URL, "", soup.get_text())  # remove links from message
-                    
-                    message_template["message"] += clean_text(message)
-                except KeyError as e:
-                    logger.exception(f"Missing key in 'part' (partial) of email message: {e}")
-                    raise KeyError(
-                        f"Missing key in 'part' (partial) of email message: {e}"
-                    )
+            for match in HTTP_HTTPS_URL.finditer(chunk):
+                links.append(match.group(0)) # extract hidden links
+            text = LexborHTMLParser(chunk).text(separator=" ")
+            message = clean_text_and_strip_urls(text)  # remove links from message
+
+        message_template["message"] += message
     return message_template, links
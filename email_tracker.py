@@ -1,10 +1,14 @@
 # https://github.com/pyautoml/GmailPy
 
-import json
+import logging
 from logging import Logger
+from functools import partial
+from types import MappingProxyType
+from time import time_ns
 from datetime import datetime
-from typing import Final, Optional
-from .utils import save_email, null_logger
+from concurrent.futures import ThreadPoolExecutor
+from typing import Final, Iterable, Optional
+from .utils import save_email, null_logger, dump_json_bytes, dump_json_line
 
 
 """
@@ -17,7 +21,23 @@ LOGGER_NAME: Final[str] ="GmailPy"
 
 class TrackedEmail:
 
-    STATUS: Final[list] = [
+    # mangled names, since the attributes are set as self.__<name>
+    __slots__ = (
+        "logger",
+        "_debug",
+        "_TrackedEmail__id",
+        "_TrackedEmail__status",
+        "_TrackedEmail__thread",
+        "_TrackedEmail__labels",
+        "_TrackedEmail__payload",
+        "_TrackedEmail__payload_bytes",
+        "_TrackedEmail__status_codes",
+        "_TrackedEmail__status_times",
+        "_TrackedEmail__stats_cache",
+        "_TrackedEmail__history_cache",
+    )
+
+    STATUS: Final[frozenset] = frozenset({
         "new",
         "read",
         "sent",
@@ -25,10 +45,12 @@ class TrackedEmail:
         "moved",
         "replied",
         "deleted",
-        "scheduled" "forwarded",
-    ]
+        "scheduled",
+        "forwarded",
+    })
+    _STATUS_MSG: Final[str] = ", ".join(sorted(STATUS))
 
-    def __init__(self, id_: str, thread: str, labels: list, payload: Optional[dict] = {}, logger: Logger = null_logger()) -> None:
+    def __init__(self, id_: str, thread: str, labels: list, payload: Optional[dict] = None, logger: Logger = null_logger()) -> None:
         """
         Initializes a new instance of TrackedEmail.
 
@@ -36,7 +58,7 @@ class TrackedEmail:
         id_ (str): The unique identifier of the email.
         thread (str): The thread identifier of the email.
         labels (list): A list of labels associated with the email.
-        payload (Optional[dict], optional): The payload of the email. Defaults to an empty dictionary.
+        payload (Optional[dict], optional): The payload of the email. Defaults to None, stored as a new empty dictionary.
 
         Attributes:
         __id (str): The unique identifier of the email.
@@ -44,36 +66,51 @@ class TrackedEmail:
         __thread (str): The thread identifier of the email.
         __labels (list): A list of labels associated with the email.
         __payload (dict): The payload of the email. Optional.
-        __status_history (list): A list of status updates for the email.
+        __payload_bytes (Optional[bytes]): The payload serialized to JSON, cached on first save.
+        __status_codes (list): Interned status codes of the status updates (see _STATUS_INTERN).
+        __status_times (list): time_ns() timestamps of the status updates, parallel to __status_codes.
+        __stats_cache (Optional[MappingProxyType]): The last 'stats' view, reset on every status update.
+        __history_cache (Optional[list]): (status, local time) pairs of the status updates formatted so far, see 'status_history'.
+                                          Created on the first read, so emails whose history is never read don't hold it.
 
         Raises:
         TypeError: If any of the parameters are not of the expected type.
         """
 
         self.logger = logger
+        # debug level is resolved once, so hot paths skip the logging call entirely when it is off
+        self._debug = logger.isEnabledFor(logging.DEBUG)
 
         if not isinstance(id_, str):
-            logger.exception(f"'id_' must be of type str, not '{type(id_)}'")
-            raise TypeError(f"'id_' must be of type str, not '{type(id_)}'")
+            msg = "'id_' must be of type str, not '%s'" % type(id_).__name__
+            logger.exception(msg)
+            raise TypeError(msg)
 
         if not isinstance(thread, str):
-            logger.exception(f"Thread must be of type str, not '{type(thread)}'")
-            raise TypeError(f"Thread must be of type str, not '{type(thread)}'")
+            msg = "Thread must be of type str, not '%s'" % type(thread).__name__
+            logger.exception(msg)
+            raise TypeError(msg)
 
         if not isinstance(labels, list):
-            logger.exception(f"Labels must be of type list, not '{type(labels)}'")
-            raise TypeError(f"Labels must be of type list, not '{type(labels)}'")
+            msg = "Labels must be of type list, not '%s'" % type(labels).__name__
+            logger.exception(msg)
+            raise TypeError(msg)
 
-        if payload and not isinstance(payload, dict):
-            logger.exception(f"Payload must be of type dict or None, not '{type(payload)}'")
-            raise TypeError(f"Payload must be of type dict or None, not '{type(payload)}'")
+        if payload is not None and not isinstance(payload, dict):
+            msg = "Payload must be of type dict or None, not '%s'" % type(payload).__name__
+            logger.exception(msg)
+            raise TypeError(msg)
 
         self.__id = id_
         self.__status = "new"
         self.__thread = thread
         self.__labels = labels
-        self.__payload = payload
-        self.__status_history: list = []
+        self.__payload = payload if payload is not None else {}
+        self.__payload_bytes: Optional[bytes] = None
+        self.__status_codes: list = []
+        self.__status_times: list = []
+        self.__stats_cache: Optional[MappingProxyType] = None
+        self.__history_cache: Optional[list] = None
         self._update_status(self.__status)
 
     @property
@@ -116,29 +153,65 @@ class TrackedEmail:
         return self.__labels
 
     @property
-    def stats(self) -> dict:
+    def status_history(self) -> list:
         """
-        Returns a dictionary containing various statistics about the email.
+        Returns the status history of the email.
 
         Parameters:
         None
 
         Returns:
-        dict: A dictionary containing the following keys:
+        list: A list of single-key dictionaries mapping each status to the local time it was set, e.g.
+              [{"new": "2024-09-01 12:00:00.123456"}].
+
+        Note:
+        The history only grows, so every entry is formatted once and kept in __history_cache;
+        repeated reads (e.g. unpack() of many emails) only format the entries added since the last one.
+        """
+        cache = self.__history_cache
+        if cache is None:
+            cache = self.__history_cache = []
+        done = len(cache)
+
+        if done < len(self.__status_codes):
+            cache.extend(
+                (status, str(datetime.fromtimestamp(ns // 1_000_000_000).replace(microsecond=ns // 1_000 % 1_000_000)))
+                for status, ns in zip(
+                    map(_STATUS_NAMES.__getitem__, self.__status_codes[done:]), self.__status_times[done:]
+                )
+            )
+        return [{status: local_time} for status, local_time in cache]
+
+    @property
+    def stats(self) -> MappingProxyType:
+        """
+        Returns a read-only view of various statistics about the email.
+        The view is built once and reused until the status changes.
+
+        Parameters:
+        None
+
+        Returns:
+        MappingProxyType: A read-only mapping containing the following keys:
             - "id": The unique identifier of the email.
             - "status": The current status of the email.
             - "thread": The thread identifier of the email.
             - "labels": A list of labels associated with the email.
         """
 
-        self.logger.debug("Sending back stats.")
+        if self._debug:
+            self.logger.debug("Sending back stats.")
         
-        return {
-            "id": self.__id,
-            "status": self.__status,
-            "thread": self.__thread,
-            "labels": self.__labels,
-        }
+        if self.__stats_cache is None:
+            self.__stats_cache = MappingProxyType(
+                {
+                    "id": self.__id,
+                    "status": self.__status,
+                    "thread": self.__thread,
+                    "labels": self.__labels,
+                }
+            )
+        return self.__stats_cache
 
     def _update_status(self, status: str) -> None:
         """
@@ -163,15 +236,17 @@ class TrackedEmail:
         None
         """
 
-        self.logger.debug("Updating email status.")
+        if self._debug:
+            self.logger.debug("Updating email status.")
 
         if status not in self.STATUS:
-            self.logger.exception(f"Status '{status}' is not supported. Please use instead: {', '.join([s for s in self.STATUS])}")
+            self.logger.exception(f"Status '{status}' is not supported. Please use instead: {self._STATUS_MSG}")
             raise ValueError(
-                f"Status '{status}' is not supported. Please use instead: {', '.join([s for s in self.STATUS])}"
+                f"Status '{status}' is not supported. Please use instead: {self._STATUS_MSG}"
             )
 
         self.__status = status
+        self.__stats_cache = None
         self._update_history(status)
 
     def unpack(self) -> dict:
@@ -180,8 +255,8 @@ class TrackedEmail:
                 "id": self.__id,
                 "thread": self.__thread,
                 "labels": self.__labels,
-                "history": self.__status_history,
-                "details": json.loads(json.dumps(self.__payload, indent=4)) if self.__payload else {},
+                "history": self.status_history,
+                "details": self.__payload or {},
             }
         except (TypeError, AttributeError, ValueError, Exception) as e:
             self.logger.exception(f"Failed to unpack email: {e}")
@@ -204,10 +279,13 @@ class TrackedEmail:
         Returns:
         None
 
-        The function appends a dictionary containing the provided status and the current timestamp to the email's status history.
+        The function appends the interned status code and a time_ns() timestamp to the email's status history.
+        Entries are formatted only when the history is read through the 'status_history' property.
         """
-        self.logger.debug("Adding status history")
-        self.__status_history.append({status: str(datetime.now())})
+        if self._debug:
+            self.logger.debug("Adding status history")
+        self.__status_codes.append(_STATUS_INTERN[status])
+        self.__status_times.append(time_ns())
 
     def _delete_history(self) -> None:
         """
@@ -220,14 +298,56 @@ class TrackedEmail:
         Returns:
         None
 
-        The status history is stored in the `__status_history` attribute as a list of dictionaries.
-        Each dictionary contains a status update and its corresponding timestamp.
-        After calling this method, the `__status_history` attribute will be set to an empty list.
+        The status history is stored in two parallel lists: `__status_codes` (interned status codes)
+        and `__status_times` (time_ns timestamps). After calling this method, both lists will be empty.
         """
-        self.logger.debug("Deleting status history")
-        self.__status_history = []
+        if self._debug:
+            self.logger.debug("Deleting status history")
+        self.__status_codes = []
+        self.__status_times = []
+        self.__history_cache = None
 
 
+    def _payload_bytes(self) -> bytes:
+        """
+        Returns the payload serialized to JSON bytes. It is computed on first use and cached afterwards, since
+        a fetched payload is not expected to change; mutating the dict returned by 'message' does not refresh it.
+
+        Parameters:
+        None
+
+        Returns:
+        bytes: The serialized payload.
+        """
+        if self.__payload_bytes is None:
+            self.__payload_bytes = dump_json_bytes(self.__payload)
+        return self.__payload_bytes
+
+    def _document_bytes(self) -> bytes:
+        """
+        Serializes the document written by _save(). Only the small envelope (id, thread, labels, history)
+        is serialized on every call; the cached payload bytes are spliced in as the 'details' key, indented one
+        level deeper, so the document is laid out exactly as dump_json_bytes(unpack()) would lay it out.
+
+        Parameters:
+        None
+
+        Returns:
+        bytes: The JSON document.
+        """
+        envelope = dump_json_bytes(
+            {
+                "id": self.__id,
+                "thread": self.__thread,
+                "labels": self.__labels,
+                "history": self.status_history,
+            }
+        )
+        # drop the closing brace of the envelope and append 'details' as its last key; JSON strings cannot
+        # contain raw line breaks, so indenting every line of the payload only shifts its layout
+        details = self._payload_bytes().replace(b"\n", b"\n  ")
+        return envelope[:-1].rstrip() + b',\n  "details": ' + details + b"\n}"
+
     def _save(self, output_path: str) -> None:
         """
         Saves the email details to a file.
@@ -246,19 +366,14 @@ class TrackedEmail:
         Exception: For any other unexpected errors.
         """
 
-        self.logger.debug("Saving email as json file.")
+        if self._debug:
+            self.logger.debug("Saving email as json file.")
 
         try:
             save_email(
                 file_path=output_path,
                 file_name=self.__id,
-                payload={
-                    "id": self.__id,
-                    "thread": self.__thread,
-                    "labels": self.__labels,
-                    "history": self.__status_history,
-                    "details": json.loads(json.dumps(self.__payload, indent=4)) if self.__payload else {},
-                },
+                payload=self._document_bytes(),
             )
         except FileNotFoundError:
             self.logger.exception(f"Failed to save email: File not found at {output_path}")
@@ -273,3 +388,69 @@ class TrackedEmail:
         except Exception as e:
             self.logger.exception(f"Failed to save email: {e}")
             raise Exception(f"Failed to save email: {e}")
+
+    @classmethod
+    def save_many(cls, emails: Iterable["TrackedEmail"], output_path: str, max_workers: Optional[int] = None) -> None:
+        """
+        Saves several emails to files, overlapping the file writes in a thread pool.
+
+        Parameters:
+        emails (Iterable[TrackedEmail]): The emails to be saved.
+        output_path (str): The path where the email details will be saved.
+        max_workers (Optional[int]): The maximum number of writer threads. Defaults to the ThreadPoolExecutor default.
+
+        Returns:
+        None
+
+        Raises:
+        FileNotFoundError, PermissionError, Exception: The first error raised by _save() for any of the emails.
+        """
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for _ in executor.map(partial(cls._save, output_path=output_path), emails):
+                pass
+
+    @classmethod
+    def save_many_ndjson(cls, emails: Iterable["TrackedEmail"], file_path: str, logger: Logger = null_logger()) -> None:
+        """
+        Saves several emails to a single NDJSON file, one compact JSON document (see unpack()) per line.
+        Meant for bulk export: one file is created and appended to through a 1 MiB write buffer,
+        instead of creating one file per email as save_many() does.
+
+        Parameters:
+        emails (Iterable[TrackedEmail]): The emails to be saved.
+        file_path (str): The path of the NDJSON file. An existing file is overwritten.
+        logger (Logger): The logger to be used. Defaults to a null logger.
+
+        Returns:
+        None
+
+        Raises:
+        FileNotFoundError: If the directory of the file does not exist.
+        PermissionError: If the user does not have the necessary permissions to write to the file.
+        Exception: For any other unexpected errors.
+        """
+
+        try:
+            with open(file_path, "wb", buffering=1 << 20) as file:
+                write = file.write
+                for email in emails:
+                    write(dump_json_line(email.unpack()))
+        except FileNotFoundError:
+            logger.exception(f"Failed to save emails: File not found at {file_path}")
+            raise FileNotFoundError(
+                f"Failed to save emails: File not found at {file_path}"
+            )
+        except PermissionError:
+            logger.exception(f"Failed to save emails: Permission denied for {file_path}")
+            raise PermissionError(
+                f"Failed to save emails: Permission denied for {file_path}"
+            )
+        except Exception as e:
+            logger.exception(f"Failed to save emails: {e}")
+            raise Exception(f"Failed to save emails: {e}")
+
+
+# statuses are stored in the history as small ints: name -> code, and code -> name
+_STATUS_NAMES: Final[tuple] = tuple(sorted(TrackedEmail.STATUS))
+_STATUS_INTERN: Final[dict] = {name: code for code, name in enumerate(_STATUS_NAMES)}
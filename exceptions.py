@@ -1,8 +1,6 @@
 # https://github.com/pyautoml/GmailPy
 
-import inspect
 from functools import wraps
-from googleapiclient.errors import HttpError
 
 
 """
@@ -188,6 +186,37 @@ class UtilsEmailError(UtilsException):
 # ---------------
 # method based
 # ---------------
+# exception type -> (raised GmailPy exception, message prefix), built on the first translated error
+_EXC_MAP = None
+
+
+def _exception_map() -> dict:
+    """
+    Returns the exception map used by gmail_api_exceptions. googleapiclient is imported here rather than
+    at module load, so importing this module stays cheap for code that never hits the Gmail API.
+
+    Returns:
+    dict: Exception type -> (GmailPy exception type, message prefix).
+    """
+
+    global _EXC_MAP
+
+    if _EXC_MAP is None:
+        exc_map = {
+            KeyError: (GmailPayloadError, "Missing key in data"),
+            TimeoutError: (GmailApiCallTimeoutError, "API call timed out"),
+            Exception: (GmailServiceError, "General error"),
+        }
+        try:
+            from googleapiclient.errors import HttpError
+            exc_map[HttpError] = (GmailHttpError, "HTTP error occurred")
+        except ImportError:
+            # without googleapiclient no HttpError can be raised, so there is nothing to map
+            pass
+        _EXC_MAP = exc_map
+    return _EXC_MAP
+
+
 def gmail_api_exceptions(func):
     """
     A decorator function that wraps around a Gmail API function and handles specific exceptions.
@@ -208,21 +237,15 @@ def gmail_api_exceptions(func):
     @wraps(func)
     def wrapper(*args, **kwargs):
         try:
-            if inspect.ismethod(func):
-                instance = args[0]
-                return func(instance, *args[1:], **kwargs)
-            else:
-                return func(*args, **kwargs)
-        except HttpError as e:
-            raise GmailHttpError(f"HTTP error occurred: {e}")
-        except KeyError as e:
-            raise GmailPayloadError(f"Missing key in data: {e}")
-        except TimeoutError as e:
-            raise GmailApiCallTimeoutError(f"API call timed out: {e}")
-        except GmailSetupError as e:
-            raise GmailSetupError(f"Setup error: {e}")
+            return func(*args, **kwargs)
+        except GmailServiceError:
+            # already a GmailPy error (e.g. GmailSetupError), keep its type and traceback
+            raise
         except Exception as e:
-            raise GmailServiceError(f"General error: {e}")
+            # nearest mapped base class wins, Exception itself maps to GmailServiceError
+            exc_map = _exception_map()
+            error, prefix = next(exc_map[cls] for cls in type(e).__mro__ if cls in exc_map)
+            raise error(f"{prefix}: {e}") from e
     return wrapper
 
 
@@ -240,6 +263,10 @@ def non_empty_string(string: str) -> None:
     TypeError: If the input is not of string type.
     ValueError: If the input string is empty.
     """
+    # fast path for the common case: exact str, non-empty (str subclasses such as str enums take the full checks)
+    if type(string) is str and string:
+        return
+
     if not isinstance(string, str):
         raise TypeError("This parameter must be a string type.")
 
@@ -261,6 +288,10 @@ def non_empty_dict(dictionary: dict) -> None:
     TypeError: If the input is not of dict type.
     ValueError: If the input dict is empty.
     """
+    # fast path for the common case: exact dict, non-empty
+    if type(dictionary) is dict and dictionary:
+        return
+
     if not isinstance(dictionary, dict):
         raise TypeError("This parameter must be a dict type.")
 
@@ -1,21 +1,31 @@
 # https://github.com/pyautoml/GmailPy
 
+import os
 import sys
+from sys import intern
 import json
+import time
 import base64
 import logging
+import httplib2
+import threading
 from collections import deque
+from operator import methodcaller
+from types import MappingProxyType
+from concurrent.futures import Future, ThreadPoolExecutor
 from email.mime.text import MIMEText
 from googleapiclient.discovery import build
-from ratelimit import limits, sleep_and_retry
 from googleapiclient.discovery import Resource
+from googleapiclient.http import HttpRequest
+from googleapiclient.errors import HttpError
+from google_auth_httplib2 import AuthorizedHttp
 from google.oauth2.credentials import Credentials
 from google.auth.transport.requests import Request
-from typing import Generator, Final, List, Optional
-from google_auth_oauthlib.flow import InstalledAppFlow
+from typing import Any, Callable, Generator, Final, Iterable, List, Optional
 
 # custom
 from gmailpy.email_tracker import TrackedEmail
+from gmailpy.rate_limiter import AdaptiveLimit, Cooldown, TokenBucket, call_with_backoff, is_throttled
 from gmailpy.email_enumerators import (
     LabelType, 
     LinksType
@@ -36,14 +46,14 @@ from gmailpy.exceptions import (
     TokenSerializationException
 )
 from gmailpy.utils import (
-    clean_text,
     save_token, 
     load_token,
     file_exists,
     null_logger,
     verify_limit,
     color_message,
-    remove_unicode,
+    encode_raw_message,
+    clean_message,
     validate_email_,
     validate_bulk_emails,
     setup_console_logger,
@@ -51,11 +61,14 @@ from gmailpy.utils import (
     is_attachment_allowed
 )
 from gmailpy.email_sections import (
+    _BATCH_LIMIT,
     add_links,
     get_labels,
-    create_visible_label,
-    create_hidden_label,
-    delete_label,
+    label_body,
+    create_labels,
+    delete_labels,
+    download_attachments,
+    get_messages,
     email_basic_information,
     email_message_from_partial,
 )
@@ -81,7 +94,21 @@ The Gmail class has the following key features:
 
 MAX_API_CALLS: int = 3
 API_AWAIT_PERIOD: int = 10
+MAX_CONCURRENT_CALLS: int = 10
+INITIAL_CONCURRENT_CALLS: int = 4  # adjusted at runtime between 1 and MAX_CONCURRENT_CALLS (see _submit)
+HTTP_TIMEOUT: int = 30  # seconds, per socket operation
+LABELS_CACHE_TTL: int = 3600  # seconds
+MAX_ATTACHMENT_BATCH_BYTES: int = 25 * 1024 * 1024  # attachment data downloaded (and held) by a single call
+MAX_LIST_PAGE_SIZE: int = 500  # the largest 'maxResults' accepted by messages.list
+BATCH_MODIFY_LIMIT: int = 1000  # the most message IDs accepted by messages.batchModify
+BATCH_DELETE_LIMIT: int = 1000  # the most message IDs accepted by messages.batchDelete
+# the message fields read by _get_emails when 'raw' is False (_store_email, __email_extractor, __get_attachments)
+MESSAGE_FIELDS: Final[str] = "id,threadId,labelIds,internalDate,snippet,payload(mimeType,headers,body/data,parts)"
+# the custom email data every structured message starts from; 'links' is mutable, so it is created per message
+MESSAGE_TEMPLATE: Final[MappingProxyType] = MappingProxyType({"from": None, "to": None, "subject": None, "message": ""})
+EMAIL_COLUMNS: Final[tuple] = ("id", "thread_id", "from", "to", "subject", "internal_date", "snippet", "label_ids")
 LOGGER_NAME: Final[str] ="GmailPy"
+_unpack: Final[Callable] = methodcaller("unpack")
 
 
 class GmailService:
@@ -112,8 +139,9 @@ class GmailService:
             - 'credentials_file': The path to the credentials file.
             - 'scopes': A string containing the scopes for the Gmail API client, separated by commas.
             - 'protected_labels': A string containing the protected labels, separated by commas.
-        max_api_calls (int): Limits max api calls per method. Overwrites global variable MAX_API_CALLS. None by default.
-        api_await_period (int): Time gap between renewed api calls. Overwrites global variable API_AWAIT_PERIOD. None by default.
+        max_api_calls (int): Limits max api calls per 'api_await_period' for this instance. Overrides the default MAX_API_CALLS. None by default.
+        api_await_period (int): Time period (in seconds) of the 'max_api_calls' limit. Overrides the default API_AWAIT_PERIOD. None by default.
+            If neither is set, calls are not paced client-side and only throttled calls (HTTP 429) are retried with backoff.
         logger (logging.Logger): Your custom logger. None by default.
         log_level (str): If logger is used, specify logging level. None by default.
 
@@ -132,6 +160,14 @@ class GmailService:
 
         self.__setup_verification(setup=setup)
         self.__apicall_verification(max_api_calls, api_await_period)
+        # independent API calls run here, MAX_CONCURRENT_CALLS at a time, each worker with its own transport
+        self._executor = ThreadPoolExecutor(max_workers=MAX_CONCURRENT_CALLS, thread_name_prefix=LOGGER_NAME)
+        self._concurrency = AdaptiveLimit(INITIAL_CONCURRENT_CALLS, 1, MAX_CONCURRENT_CALLS)
+        # attachments are written to disk here while the next download runs (see __get_attachments)
+        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"{LOGGER_NAME}-writer")
+        self._pending_writes: List[Future] = []
+        self._local = threading.local()
+        self._transports: List[AuthorizedHttp] = []  # every transport opened by this instance, closed by _close
         self.service: Resource = self._connect()
         self._collect_labels()
         
@@ -158,8 +194,9 @@ class GmailService:
 
         if not isinstance(setup, dict):
             self.logger.exception(color_message(f"'setup' parameter must be a dict, not '{type(setup)}'"))
-            if 'invalid_grant' or 'Bad Request' in f"{setup}":
-                raise GmailSetupError(f"Gmail credentials error: {setup}")
+            setup_text = str(setup)
+            if "invalid_grant" in setup_text or "Bad Request" in setup_text:
+                raise GmailSetupError(f"Gmail credentials error: {setup_text}")
             raise GmailSetupError(f"'setup' parameter must be a dict, not '{type(setup)}'")
 
         if not setup:
@@ -178,18 +215,16 @@ class GmailService:
             self.credentials_file: str = setup.get("credentials_file")
             self.__scopes: List[str] = setup.get("scopes")
             self.__labels: dict = {}
-            self._emails: list = deque()
-            self.__protected_labels: list = setup.get("protected_labels", None)
-            
-            if self.__protected_labels:
-                self.__protected_labels.split(",")
+            self._emails: deque[TrackedEmail] = deque()
+            # column (SoA) view of the fetched emails, one list per field, parallel to self._emails
+            self._email_columns: dict = {field: [] for field in EMAIL_COLUMNS}
+            protected_labels: Optional[str] = setup.get("protected_labels", None)
+            self.__protected_labels: frozenset = frozenset(
+                filter(None, (label.strip() for label in protected_labels.split(",")))
+            ) if protected_labels else frozenset()
             
             self.__scopes = self.__scopes.split(",")
-            token_exists = file_exists(self.token_file, silent_error=True)
-
-            if not token_exists:
-                self.__create_new_token()
-
+            # the token file is read (or created) once, by __check_token in _connect
             self.credentials_file = file_exists(self.credentials_file)
         except (UtilsFileError, UtilsException) as e:
             logging.critical(f"File processing related error: {e}. Program will shut down.")
@@ -207,7 +242,9 @@ class GmailService:
         Note:
         - The function checks if the provided parameters are positive integers.
         - If the parameters are not positive integers, the function will print a warning message and use the default values.
-        - The function sets the global variables MAX_API_CALLS and API_AWAIT_PERIOD with the provided or default values.
+        - If a valid limit is set, the function creates the instance token bucket (see _call) from the provided or default values.
+          Otherwise calls are not paced and self._bucket is None.
+          The module constants MAX_API_CALLS and API_AWAIT_PERIOD are the defaults and are not modified.
 
         Parameters:
         max_api_calls (int): The maximum number of API calls allowed.
@@ -218,25 +255,169 @@ class GmailService:
         """
         self.logger.debug("Verifying apicalls setup: MAX_API_CALLS and API_AWAIT_PERIOD.")
 
+        self.max_api_calls: int = MAX_API_CALLS
+        self.api_await_period: int = API_AWAIT_PERIOD
+        paced = False
+
         if max_api_calls:
             if isinstance(max_api_calls, int) and max_api_calls > 0:
-                global MAX_API_CALLS
-                MAX_API_CALLS = max_api_calls
-                self.logger.debug(f"Set up custom MAX_API_CALLS value: {MAX_API_CALLS}")
+                self.max_api_calls = max_api_calls
+                paced = True
+                self.logger.debug("Set up custom max_api_calls value: %s", max_api_calls)
             else:
                 self.logger.warning(f"'max_api_calls' must be int > 0, not '{max_api_calls}'. Using default value: '{MAX_API_CALLS}'")
 
         if api_await_period:
             if isinstance(api_await_period, int) and api_await_period > 0:
-                global API_AWAIT_PERIOD
-                API_AWAIT_PERIOD = api_await_period
-                self.logger.debug(f"Set up custom API_AWAIT_PERIOD value: {API_AWAIT_PERIOD}")
+                self.api_await_period = api_await_period
+                paced = True
+                self.logger.debug("Set up custom api_await_period value: %s", api_await_period)
             else:
                 self.logger.warning(f"'api_await_period' must be int > 0, not '{api_await_period}'. Using default value: '{API_AWAIT_PERIOD}'")
 
+        # without an explicit limit, calls only wait when Gmail actually throttles them (see call_with_backoff)
+        self._bucket = TokenBucket(rate=self.max_api_calls, per=self.api_await_period) if paced else None
+        # once Gmail throttles a call, every call of this instance waits out the retry delay
+        self._cooldown = Cooldown()
+
+    def _call(self, func: Callable[[], Any], idempotent: bool = True) -> Any:
+        """
+        Runs a single Gmail API call under the instance rate limit. If a limit is set, the call waits for a token
+        of the instance token bucket. It is retried with backoff on rate limit errors and transient 5xx errors,
+        and a throttled call pauses all calls of the instance (see Cooldown).
+
+        Parameters:
+        func (Callable[[], Any]): The API call, e.g. a prepared request's 'execute' method.
+        idempotent (bool): Set to False for calls with side effects that must not be repeated (sending an email,
+                           creating a draft): they are retried on rate limit errors only, never on 5xx errors.
+
+        Returns:
+        Any: The result of 'func'.
+
+        Raises:
+        HttpError: If the call failed with a non-retryable status, or all attempts failed.
+        """
+        return call_with_backoff(func, self._bucket, self.logger, cooldown=self._cooldown, idempotent=idempotent)
+
+    def _thread_http(self) -> AuthorizedHttp:
+        """
+        Returns the HTTP transport of the current thread. httplib2 connections are not thread-safe,
+        so every executor worker authorizes its own transport with the shared credentials.
+
+        Parameters:
+        None
+
+        Returns:
+        AuthorizedHttp: The transport of the current thread.
+        """
+        http = getattr(self._local, "http", None)
+        if http is None:
+            http = self._local.http = AuthorizedHttp(self.credentials, http=httplib2.Http(timeout=HTTP_TIMEOUT))
+            self._transports.append(http)
+        return http
+
+    def _drop_thread_http(self) -> None:
+        """
+        Closes and forgets the HTTP transport of the current thread after a connection error,
+        so the next call of the thread opens fresh connections instead of reusing broken ones.
+
+        Parameters:
+        None
+
+        Returns:
+        None
+        """
+        http = getattr(self._local, "http", None)
+        if http is not None:
+            self._local.http = None
+            self._transports.remove(http)
+            http.close()
+
+    def _close(self) -> None:
+        """
+        Waits for the running API calls and attachment writes, shuts the executors down and closes all HTTP connections
+        of this instance. The instance can't make API calls afterwards.
+
+        Parameters:
+        None
+
+        Returns:
+        None
+        """
+        self.logger.debug("Closing %d HTTP transport(s).", len(self._transports))
+        self._executor.shutdown(wait=True)
+        self._writer.shutdown(wait=True)
+        for http in self._transports:
+            http.close()
+        self._transports.clear()
+
+    def _call_limited(self, func: Callable[[], Any], idempotent: bool = True) -> Any:
+        """
+        Runs an API call (see _call) from an executor worker, under the adaptive concurrency limit.
+        Successful attempts let the limit grow, throttled ones shrink it (see AdaptiveLimit).
+
+        Parameters:
+        func (Callable[[], Any]): The API call, e.g. a prepared request's 'execute' method.
+        idempotent (bool): False if the call must not be retried on 5xx errors (see _call).
+
+        Returns:
+        Any: The result of 'func'.
+
+        Raises:
+        HttpError: If the call failed with a non-retryable status, or all attempts failed.
+        """
+        epoch = self._concurrency.acquire()
+
+        def attempt() -> Any:
+            try:
+                result = func()
+            except HttpError as e:
+                if is_throttled(e):
+                    self._concurrency.on_throttle(epoch)
+                raise
+            except (OSError, httplib2.HttpLib2Error):
+                self._drop_thread_http()
+                raise
+            self._concurrency.on_success()
+            return result
+
+        try:
+            return self._call(attempt, idempotent=idempotent)
+        finally:
+            self._concurrency.release()
+
+    def _submit(self, request: HttpRequest, idempotent: bool = True) -> Future:
+        """
+        Executes a prepared API request on the executor. The adaptive concurrency limit (at most the pool size)
+        bounds the number of requests in flight, while _call keeps every request within the instance rate limit.
+
+        Parameters:
+        request (HttpRequest): A prepared (not yet executed) Gmail API request.
+        idempotent (bool): False if the request must not be retried on 5xx errors (see _call).
+
+        Returns:
+        Future: The future of the API response.
+        """
+        return self._executor.submit(self._call_limited, lambda: request.execute(http=self._thread_http()), idempotent)
+
+    def _execute_parallel(self, requests: List[HttpRequest], idempotent: bool = True) -> List[Any]:
+        """
+        Executes independent API requests concurrently (see _submit) and waits for all of them.
+
+        Parameters:
+        requests (List[HttpRequest]): Prepared (not yet executed) Gmail API requests.
+        idempotent (bool): False if the requests must not be retried on 5xx errors (see _call).
+
+        Returns:
+        List[Any]: The API responses, in the same order as 'requests'.
+
+        Raises:
+        HttpError: The error of the first failed request, in the order of 'requests'.
+        """
+        futures = [self._submit(request, idempotent) for request in requests]
+        return [future.result() for future in futures]
+
 
-    @sleep_and_retry
-    @limits(calls=MAX_API_CALLS, period=API_AWAIT_PERIOD)
     @gmail_api_exceptions
     def __refresh_token(self) -> None:
         """
@@ -261,15 +442,13 @@ class GmailService:
         self.logger.info("Refreshing token.")
 
         try:
-            self.credentials.refresh(Request())
-            save_token(self.token_file, self.credentials)
+            self._call(lambda: self.credentials.refresh(Request()))
+            save_token(self.token_file, json.loads(self.credentials.to_json()))
         except (GmailHttpError, GmailPayloadError, GmailApiCallTimeoutError, GmailSetupError, GmailServiceError) as e:
             logging.critical(f"Api Call exception: {e}. Program will shut down.")
             logging.exception("Exception details: ")
             sys.exit(1)
 
-    @sleep_and_retry
-    @limits(calls=MAX_API_CALLS, period=API_AWAIT_PERIOD)
     @gmail_api_exceptions
     def __create_new_token(self) -> None:
         """
@@ -294,12 +473,17 @@ class GmailService:
         """
         self.logger.info("Creating new token.")
 
+        # imported here, since only the first authorization needs it and it pulls in oauthlib and requests-oauthlib
+        from google_auth_oauthlib.flow import InstalledAppFlow
+
         try:
             flow = InstalledAppFlow.from_client_secrets_file(self.credentials_file, self.__scopes)
             self.credentials = flow.run_local_server(port=0)
 
-            self.logger.debug("Saving locally new token: token.pickle")
-            save_token(self.token_file, self.credentials)
+            self.logger.debug("Saving locally new token: %s", self.token_file)
+            save_token(self.token_file, json.loads(self.credentials.to_json()))
+            # the new token may belong to a different account, so its labels must not come from the old cache
+            self.__remove_labels_cache()
         except (GmailHttpError, GmailPayloadError, GmailApiCallTimeoutError, GmailSetupError, GmailServiceError) as e:
             logging.critical(f"Api Call exception: {e}. Program will shut down.")
             logging.exception("Exception details: ")
@@ -329,7 +513,9 @@ class GmailService:
         GmailService: If an error occurs during the token refresh process.
         """
         self.logger.debug("Validating token.")
-        self.credentials = load_token(self.token_file)
+        token = load_token(self.token_file)
+        # tokens saved by earlier versions are pickled Credentials, newer ones are the authorized user info
+        self.credentials = Credentials.from_authorized_user_info(token) if isinstance(token, dict) else token
         if not self.credentials or not self.credentials.valid:
             try:
                 if (
@@ -364,16 +550,100 @@ class GmailService:
         """
         return self.__labels
 
+    @property
+    def _get_labels_sorted(self) -> dict:
+        """
+        Retrieves the dictionary of labels sorted alphabetically by label names.
+        The sorted copy is built on every call, so only code that needs the order pays for it.
+
+        Parameters:
+        None
+
+        Returns:
+        dict: A dictionary where keys are label names (sorted) and values are label IDs.
+        """
+        return dict(sorted(self.__labels.items()))
+
+
+    @property
+    def _labels_cache_file(self) -> str:
+        """
+        Returns the path of the labels cache file, stored next to the token file.
+
+        Parameters:
+        None
+
+        Returns:
+        str: The path of the labels cache file: '<token_file>.labels.json'.
+        """
+        return f"{self.token_file}.labels.json"
+
+    def __load_labels_cache(self) -> Optional[dict]:
+        """
+        Loads the labels cache file if it is younger than LABELS_CACHE_TTL.
+
+        Parameters:
+        None
+
+        Returns:
+        Optional[dict]: The cached label names and IDs, or None if the cache is missing, expired or unreadable.
+        """
+        try:
+            with open(self._labels_cache_file, "r", encoding="utf-8") as f:
+                cache = json.load(f)
+
+            if time.time() - cache["fetched_at"] < LABELS_CACHE_TTL and isinstance(cache["labels"], dict):
+                return cache["labels"]
+            self.logger.debug("Labels cache expired.")
+        except FileNotFoundError:
+            self.logger.debug("No labels cache found.")
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            self.logger.debug("Ignoring unreadable labels cache: %s", e)
+        return None
+
+    def __remove_labels_cache(self) -> None:
+        """
+        Removes the labels cache file and empties the internal label dictionary. A failed removal is logged
+        and ignored.
+
+        Parameters:
+        None
+
+        Returns:
+        None
+        """
+        self.__labels = {}
+        try:
+            os.remove(self._labels_cache_file)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            self.logger.warning(f"Failed to remove labels cache: {e}")
+
+    def __save_labels_cache(self) -> None:
+        """
+        Writes the internal label dictionary to the labels cache file. A failed write is logged and ignored,
+        since the labels are fetched from the API again on the next start.
+
+        Parameters:
+        None
+
+        Returns:
+        None
+        """
+        try:
+            with open(self._labels_cache_file, "w", encoding="utf-8") as f:
+                json.dump({"fetched_at": time.time(), "labels": self.__labels}, f)
+        except OSError as e:
+            self.logger.warning(f"Failed to save labels cache: {e}")
 
-    @sleep_and_retry
-    @limits(calls=MAX_API_CALLS, period=API_AWAIT_PERIOD)
     @gmail_api_exceptions
-    def _collect_labels(self) -> list:
+    def _collect_labels(self, refresh: bool = False) -> list:
         """
         Collects all labels associated with the Gmail account and stores them in the internal label dictionary.
 
         Parameters:
-        None
+        refresh (bool): If True, fetch the labels from the API even if the labels cache is still valid. False by default.
 
         Returns:
         list: A list of all labels retrieved from the Gmail account.
@@ -382,33 +652,91 @@ class GmailService:
         None
 
         Note:
-        - The function retrieves all labels using the 'get_labels' function.
-        - If labels are successfully retrieved, they are stored in the '__labels' dictionary with label names as keys and label IDs as values.
-        - The '__labels' dictionary is then sorted alphabetically by label names.
+        - Labels are read from the labels cache file ('<token_file>.labels.json') if it is younger than LABELS_CACHE_TTL.
+        - Otherwise the function retrieves all labels using the 'get_labels' function and rewrites the cache.
+        - If labels are successfully retrieved, they replace the '__labels' dictionary with label names as keys and label IDs as values.
+        - The '__labels' dictionary keeps the API order. Use '_get_labels_sorted' for an alphabetical view.
         """
 
         self.logger.debug("Collecting labels.")
-        all_labels = get_labels(self.service, self.logger)
 
+        if not refresh:
+            cached_labels = self.__load_labels_cache()
+            if cached_labels is not None:
+                self.__labels = cached_labels
+                self.logger.debug("Collected %d label(s) from cache.", len(self.__labels))
+                return
+
+        all_labels = self._call(lambda: get_labels(self.service, self.logger))
+
+        # rebuilt rather than updated, so labels deleted since the last fetch do not linger
+        labels = {}
         if all_labels:
             for label in all_labels:
-                self.__labels[f"{label['name']}"] = label["id"]
-            self.__labels = dict(sorted(self.__labels.items()))
-        self.logger.debug(f"Collected {len(self.__labels)} label(s).")
+                labels[f"{label['name']}"] = label["id"]
+        self.__labels = labels
+        self.__save_labels_cache()
+        self.logger.debug("Collected %d label(s).", len(self.__labels))
 
 
-    @sleep_and_retry
-    @limits(calls=MAX_API_CALLS, period=API_AWAIT_PERIOD)
     @gmail_api_exceptions
+    def _create_labels(self, label_names: List[str], label_type: LabelType = LabelType.VISIBLE) -> dict:
+        """
+        Creates new labels in the user's mailbox with batched API calls.
+        Note:
+        - Labels that already exist (or repeat in 'label_names') are not created again.
+        - Every created label is added to the internal label dictionary as soon as its batch completes,
+          so a retried call (see _call) only sends the labels that are still missing.
+
+        Parameters:
+        label_names (List[str]): The names of the labels to be created.
+        label_type (LabelType, optional): The type of the labels. Defaults to LabelType.VISIBLE.
+
+        Returns:
+        dict: The created labels: label names as keys and label IDs as values.
+
+        Raises:
+        GmailHttpError: If an HTTP error occurs during the API call.
+        GmailApiCallTimeoutError: If the API call times out.
+        GmailPayloadError: If a key is missing in email/data payload.
+        GmailServiceError: If an unhandled exception occurs during the API call.
+        """
+        self.logger.info("Creating %d label(s) of type: %s", len(label_names), label_type)
+
+        for label_name in label_names:
+            non_empty_string(label_name)
+
+        created: dict = {}
+        visible = label_type == LabelType.VISIBLE
+
+        def create_missing() -> None:
+            missing = [label_name for label_name in dict.fromkeys(label_names) if label_name not in self.__labels]
+            if not missing:
+                return
+
+            def store(index: int, label: dict) -> None:
+                if "id" in label:
+                    self.__labels[label["name"]] = created[label["name"]] = label["id"]
+                else:
+                    self.logger.error(color_message("Warning: Failed to create label '%s'. Label should contain 'id' key. Check Gmail API Documentation to track changes."), missing[index])
+
+            create_labels([label_body(label_name, visible) for label_name in missing], self.service, self.logger, on_response=store)
+
+        try:
+            self._call(create_missing)
+        finally:
+            if created:
+                self.__save_labels_cache()
+        return created
+
     def _create_label(
         self, label_name: str, label_type: LabelType = LabelType.VISIBLE
     ) -> None:
         """
-        Creates a new label in the user's mailbox.
+        Creates a new label in the user's mailbox (see _create_labels).
         Note:
         - If the label with the same name already exists, it will not be created again.
         - The created label will be added to the internal label dictionary.
-        - The label dictionary will be sorted after the new label is added.
 
         Parameters:
         label_name (str): The name of the label to be created.
@@ -420,30 +748,64 @@ class GmailService:
         Raises:
         None
         """
-        self.logger.info(f"Creating new label: {label_name} of type: {label_type.value}")
+        self.logger.info("Creating new label: %s of type: %s", label_name, label_type)
         non_empty_string(label_name)
 
-        if label_name not in self._get_labels.keys():
-            label: dict = (
-                create_visible_label(label_name, self.service, self.logger)
-                if label_type == LabelType.VISIBLE
-                else create_hidden_label(self.logger)
-            )
-            
-            if "id" in label.keys():
-                self.__labels[label["name"]] = label["id"]
-                self.__labels = dict(sorted(self.__labels.items()))
-            else:
-                self.logger.error(color_message("Warning: Failed to create label. Label should contain 'id' key. Check Gmail API Documentation to track changes."))
-        else:
-            self.logger.debug(f"Label: {label_name} of type: {label_type.value} already exists.")
+        if label_name in self.__labels:
+            self.logger.debug("Label: %s of type: %s already exists.", label_name, label_type)
+            return
+        self._create_labels([label_name], label_type)
 
-    @sleep_and_retry
-    @limits(calls=MAX_API_CALLS, period=API_AWAIT_PERIOD)
     @gmail_api_exceptions
+    def _delete_labels(self, label_names: List[str]) -> List[str]:
+        """
+        Deletes labels from the user's mailbox with batched API calls.
+        [!] WARNING: Deleting a label will automatically delete all emails assigned to that label.
+        Note:
+        - Labels that do not exist or are protected are skipped.
+        - Every deleted label is removed from the internal label dictionary as soon as its batch completes,
+          so a retried call (see _call) only sends the labels that still exist.
+
+        Parameters:
+        label_names (List[str]): The names of the labels to be deleted.
+
+        Returns:
+        List[str]: The names of the deleted labels.
+
+        Raises:
+        GmailHttpError: If an HTTP error occurs during the API call.
+        GmailApiCallTimeoutError: If the API call times out.
+        GmailPayloadError: If a key is missing in email/data payload.
+        GmailServiceError: If an unhandled exception occurs during the API call.
+        """
+        self.logger.info("Deleting %d label(s).", len(label_names))
+        protected_labels = self.__protected_labels
+        deleted: List[str] = []
+
+        def delete_existing() -> None:
+            existing = [
+                label_name for label_name in dict.fromkeys(label_names)
+                if label_name in self.__labels and label_name not in protected_labels
+            ]
+            if not existing:
+                return
+
+            def forget(index: int, response: Any) -> None:
+                del self.__labels[existing[index]]
+                deleted.append(existing[index])
+
+            delete_labels([self.__labels[label_name] for label_name in existing], self.service, self.logger, on_response=forget)
+
+        try:
+            self._call(delete_existing)
+        finally:
+            if deleted:
+                self.__save_labels_cache()
+        return deleted
+
     def _delete_label(self, label_name: str) -> bool:
         """
-        Deletes a label from the user's mailbox.
+        Deletes a label from the user's mailbox (see _delete_labels).
         [!] WARNING: Deleting a label will automatically delete all emails assigned to that label.
 
         Parameters:
@@ -455,54 +817,73 @@ class GmailService:
         Raises:
         None
         """
-        self.logger.info(f"Deleting label {label_name}")
-        if (
-            label_name in self._get_labels.keys()
-            and label_name not in self.__protected_labels
-        ):
-            delete_label(
-                label_name=label_name,
-                label_id=self._get_labels[label_name],
-                service=self.service,
-                logger=self.logger
-            )
-            self.logger.debug(f"Label {label_name} deleted.")
+        self.logger.info("Deleting label %s", label_name)
+        if self._delete_labels([label_name]):
+            self.logger.debug("Label %s deleted.", label_name)
             return True
-        self.logger.debug(f"Failed to delete label {label_name}")
+        self.logger.debug("Failed to delete label %s", label_name)
         return False
     
 
-    @sleep_and_retry
-    @limits(calls=MAX_API_CALLS, period=API_AWAIT_PERIOD)
     @gmail_api_exceptions
-    def __download_attachments(self, message_id: str, attachment_id: str) -> str|None:
+    def __download_attachments(self, message_id: str, attachment_ids: List[str], skip_failed: bool = False) -> List[str|None]:
         """
-        Downloads an attachment from the Gmail message.
+        Downloads attachments from the Gmail message. All attachments are fetched through the batch endpoint,
+        so the call counts as a single rate-limited API call.
 
         Parameters:
-        message_id (str): The unique identifier of the Gmail message from which the attachment is to be downloaded.
-        attachment_id (str): The unique identifier of the attachment to be downloaded.
+        message_id (str): The unique identifier of the Gmail message from which the attachments are to be downloaded.
+        attachment_ids (List[str]): The unique identifiers of the attachments to be downloaded.
+        skip_failed (bool): If True, a failed download yields None instead of raising. False by default.
 
         Returns:
-        str: The data of the downloaded attachment.
-        None: Is "data" key is not available in fetched attachment dict.
+        List[str|None]: The data of the downloaded attachments, in the same order as 'attachment_ids'.
+                        None for an attachment without "data" key (or a failed one, if 'skip_failed' is True).
 
         Raises:
-        GmailHttpError: If an HTTP error occurs during the API call to download the attachment.
-        GmailApiCallTimeoutError: If the API call to download the attachment times out.
-        GmailPayloadError: If a key is missing in the email/data payload for the attachment.
-        GmailServiceError: If an unhandled exception occurs during the API call to download the attachment.
+        GmailHttpError: If an HTTP error occurs during the API call to download the attachments.
+        GmailApiCallTimeoutError: If the API call to download the attachments times out.
+        GmailPayloadError: If a key is missing in the email/data payload for the attachments.
+        GmailServiceError: If an unhandled exception occurs during the API call to download the attachments.
         """
 
-        self.logger.info("Downloading attachments.")
-        non_empty_string(message_id)
-        non_empty_string(attachment_id)
+        return self._call(
+            lambda: download_attachments(message_id, attachment_ids, self.service, self.logger, skip_failed=skip_failed)
+        )
 
-        attachment: dict = self.service.users().messages().attachments().get(userId="me", messageId=message_id, id=attachment_id).execute()
-        if "data" in attachment:
-            return attachment["data"]
-        self.logger.debug("Failed to find 'data' key in attachment dict.")
-        return None
+    def __save_attachments(self, download_path: str, items: List[tuple], silent_error: bool) -> None:
+        """
+        Saves downloaded attachments locally. Runs on the writer thread (see __get_attachments).
+
+        Parameters:
+        download_path (str): The path where the attachments will be saved.
+        items (List[tuple]): (message part, MIME type, base64url data) of every attachment to be saved.
+        silent_error (bool): If True, a failed save is logged and skipped. If False, the error is raised.
+
+        Returns:
+        None
+        """
+        self.logger.debug("Download path: %s", download_path)
+        for part, mime_type, attachment_data in items:
+            save_status = save_local_attachment(file_path=download_path, part=part, attachment_data=attachment_data, mime_type=mime_type, silent_error=silent_error)
+            self.logger.debug("Saved local attachment status: %s", save_status) # works only if silent_error=True
+
+    def _wait_for_writes(self) -> None:
+        """
+        Waits until all attachments handed to the writer thread are saved.
+
+        Parameters:
+        None
+
+        Returns:
+        None
+
+        Raises:
+        Exception: The error of the first failed write, if any (only raised if saving is not silent).
+        """
+        pending, self._pending_writes = self._pending_writes, []
+        for future in pending:
+            future.result()
 
     def __get_attachments(
             self, 
@@ -511,11 +892,17 @@ class GmailService:
             return_attachments: bool = False, 
             download_path: Optional[str] = None, 
             skip_on_download_failure: bool = False,
-            max_attachments_number: Optional[int] = None
+            max_attachments_number: Optional[int] = None,
+            callback: Optional[Callable[[bytes, dict], None]] = None
         ) -> Optional[List[str]]:
         """
         Retrieves and saves attachments from a given Gmail message, checking their file types.
         If attachment file type is not in MIME_TYPE_MAP (utils.py), then the attachment won't be processed.
+        The allowed attachments are collected first and then downloaded with batched API calls, each call fetching
+        at most MAX_ATTACHMENT_BATCH_BYTES of attachments. The attachments of a call are saved to 'download_path'
+        on the writer thread while the next download runs; the writes of a call are awaited before the next call's
+        writes are queued, so at most two calls' data is held, unless 'return_attachments' is True.
+        Call _wait_for_writes() to make sure all files are saved (_get_emails does it before returning).
 
         Parameters:
         msg (dict): The raw message data from the Gmail API.
@@ -524,6 +911,8 @@ class GmailService:
         download_path (str, optional): The path where the attachments will be saved. If not provided, attachments will not be saved.
         max_attachments_number (positive int, optional): The maximum number of attachments that can be downloaded. None (or 0) is set by default and means 'no limit'.
         skip_on_download_failure (bool): If True: If failed to download given file, continue to the next download. If False: raise exception. False by default.
+        callback (Callable[[bytes, dict], None], optional): Called with the decoded data and the message part of every downloaded attachment,
+                                                            e.g. to stream it to custom storage. None by default.
 
         Returns:
         Optional[List[str]]: Returns a list of attachment data if attachments are found and saved successfully. Returns an empty list if no attachments are found. Returns None if no attachments are processed.
@@ -535,7 +924,7 @@ class GmailService:
         self.logger.info("Getting attachments.")
         attachments = []
 
-        if "payload" not in msg.keys():
+        if "payload" not in msg:
             self.logger.debug("Missing 'payload' key in msg keys.")
             return attachments
         
@@ -544,35 +933,69 @@ class GmailService:
             return attachments
         
         try:
-            for part in msg["payload"]["parts"]:
-                count = 0
+            # (part, mime type, attachment id) of every allowed attachment, up to max_attachments_number
+            found = []
 
+            for part in msg["payload"]["parts"]:
                 if part.get("filename"):
                     mime_type = part.get("mimeType", "")
                     is_allowed = is_attachment_allowed(mime_type=mime_type)
 
                     if not is_allowed:
-                        self.logger.warning(color_message(f"Attachment type '{mime_type}' excluded from processing."))
+                        self.logger.warning(color_message("Attachment type '%s' excluded from processing."), mime_type)
                         continue
 
                     attachment_id = part["body"].get("attachmentId")
-                    self.logger.debug(f"Found attachment id: {attachment_id}")
+                    self.logger.debug("Found attachment id: %s", attachment_id)
 
                     if attachment_id:
-                        attachment_data = self.__download_attachments(message["id"], attachment_id)
-
-                        if download_path:
-                            self.logger.debug(f"Download path: {download_path}")
-                            save_status = save_local_attachment(file_path=download_path, part=part, attachment_data=attachment_data, mime_type=mime_type, silent_error=skip_on_download_failure)
-                            self.logger.debug(f"Saved local attachment status: {save_status}") # works only if silent_error=True
-
-                            if return_attachments:
-                                attachments.append(attachment_data)
-                                self.logger.debug(f"Processing attachment: {count}/{max_attachments_number if max_attachments_number else 'no limit'}")
-                                count += 1
-                            if max_attachments_number and count >= max_attachments_number:
-                                self.logger.debug(f"Reach max attachment downloads: {count}/{max_attachments_number}")
-                                break
+                        found.append((part, mime_type, attachment_id))
+
+                        if max_attachments_number and len(found) >= max_attachments_number:
+                            self.logger.debug("Reach max attachment downloads: %d/%d", len(found), max_attachments_number)
+                            break
+
+            if not found:
+                return attachments if return_attachments else None
+
+            # split the downloads by the attachment sizes reported in the message, at least one attachment per call
+            groups, group, group_size = [], [], 0
+            for item in found:
+                size = item[0]["body"].get("size", 0)
+                if group and group_size + size > MAX_ATTACHMENT_BATCH_BYTES:
+                    groups.append(group)
+                    group, group_size = [], 0
+                group.append(item)
+                group_size += size
+            groups.append(group)
+
+            for group in groups:
+                attachments_data = self.__download_attachments(
+                    message["id"], [attachment_id for _, _, attachment_id in group], skip_failed=skip_on_download_failure
+                )
+
+                to_save = []
+
+                for (part, mime_type, _), attachment_data in zip(group, attachments_data):
+                    if attachment_data is None:
+                        self.logger.debug("No data downloaded for attachment '%s'.", part.get("filename"))
+                        continue
+
+                    if download_path:
+                        to_save.append((part, mime_type, attachment_data))
+
+                    if callback is not None:
+                        callback(base64.urlsafe_b64decode(attachment_data), part)
+
+                    if return_attachments:
+                        attachments.append(attachment_data)
+
+                if to_save:
+                    # the previous writes must be done before more data is queued, which bounds the memory held
+                    self._wait_for_writes()
+                    self._pending_writes.append(
+                        self._writer.submit(self.__save_attachments, download_path, to_save, skip_on_download_failure)
+                    )
             return attachments if return_attachments else None
         except KeyError as e:
             raise GmailPayloadError(f"Failed searching attachments. Missing key(s): {e}")
@@ -584,8 +1007,6 @@ class GmailService:
     # ----------
     # emails
     # ----------
-    @sleep_and_retry
-    @limits(calls=MAX_API_CALLS, period=API_AWAIT_PERIOD)
     @gmail_api_exceptions
     def _create_email_draft(self, draft_message: str, sender: str=None, recipient: str=None, subject:str=None) -> str:
         """
@@ -611,11 +1032,9 @@ class GmailService:
         self.logger.debug("Creating email draft.")
         non_empty_string(draft_message)
 
-        message = MIMEText(draft_message)
-        message['to'] = recipient
-        message['from'] = sender
-        message['subject'] = subject if subject else "DRAFT "
-        raw_message = base64.urlsafe_b64encode(message.as_bytes()).decode()
+        raw_message = encode_raw_message(
+            draft_message, sender=sender, recipient=recipient, subject=subject if subject else "DRAFT "
+        )
 
         draft_message = {
             'message': {
@@ -623,8 +1042,9 @@ class GmailService:
             }
         }
 
-        draft = self.service.users().drafts().create(userId="me", body=draft_message).execute()
-        self.logger.debug(f"Created draf message id: { draft['id']}")
+        # not retried on 5xx errors, which could create the draft twice
+        draft = self._call(self.service.users().drafts().create(userId="me", body=draft_message).execute, idempotent=False)
+        self.logger.debug("Created draf message id: %s", draft["id"])
         return draft['id']
 
 
@@ -679,83 +1099,131 @@ class GmailService:
 
         if cc:
             self.logger.debug("Adding CC recipients.")
-            message["cc"] = ", ".join(
-                email
-                for email in set(
-                    validate_bulk_emails(
-                        cc, 
-                        skip_invalid_emails=skip_invalid_emails,
-                        warnings_on=True,
-                    )
-                )
-            )
+            message["cc"] = self.__join_addresses(cc, skip_invalid_emails)
         if bcc:
             self.logger.debug("Adding BCC recipients.")
-            message["bcc"] = ", ".join(
-                email
-                for email in set(
-                    validate_bulk_emails(
-                        bcc, 
-                        skip_invalid_emails=skip_invalid_emails,
-                        warnings_on=True
-                    )
-                )
-            )
+            message["bcc"] = self.__join_addresses(bcc, skip_invalid_emails)
         return message
+
+    def __join_addresses(self, emails: List[str], skip_invalid_emails: bool) -> str:
+        """
+        Deduplicates a list of email addresses (keeping the first occurrence order), validates the unique ones
+        and joins them into a single header value.
+
+        Parameters:
+        emails (List[str]): The email addresses.
+        skip_invalid_emails (bool): If True, invalid addresses are dropped. If False, an invalid address raises an error.
+
+        Returns:
+        str: The valid, unique addresses separated by ", ", in the order they were given.
+
+        Raises:
+        UtilsEmailError: If an address is invalid and 'skip_invalid_emails' is False.
+        """
+        unique_emails = list(dict.fromkeys(emails))
+        # strict: addresses written into outgoing headers get the full email_validator check
+        valid_emails = validate_bulk_emails(unique_emails, skip_invalid_emails=skip_invalid_emails, strict=True)
+        # validate_bulk_emails returns None when nothing is skipped and all addresses are valid
+        return ", ".join(unique_emails if valid_emails is None else valid_emails)
         
 
-    def _mark_email_as_read(self, message_id: str) -> bool:
+    def _modify_emails(self, message_ids: List[str], add_label_ids: List[str], remove_label_ids: List[str]) -> None:
         """
-        Marks an email as read by removing the 'UNREAD' label.
+        Applies the same label change to many emails with messages.batchModify, at most BATCH_MODIFY_LIMIT
+        emails per API call. The calls of a larger set are sent concurrently (see _execute_parallel).
 
         Parameters:
-        message_id (str): The ID of the message to modify.
+        message_ids (List[str]): The IDs of the messages to modify. Duplicates are sent once.
+        add_label_ids (List[str]): The IDs of the labels to add.
+        remove_label_ids (List[str]): The IDs of the labels to remove.
 
         Returns:
-        bool: True is successfully marked email as 'read', else False.
+        None
+
+        Raises:
+        HttpError: If any of the API calls failed.
         """
-        self.logger.debug("Marking email as 'READ'.")
-        try:
-            self.service.users().messages().modify(
-                userId='me',
-                id=message_id,
+        message_ids = list(dict.fromkeys(message_ids))
+        batch_modify = self.service.users().messages().batchModify
+        requests = [
+            batch_modify(
+                userId="me",
                 body={
-                    'removeLabelIds': ['UNREAD'],
-                    'addLabelIds': []
-                }
-            ).execute()
-            self.logger.debug("Email marked as 'READ'.")
+                    "ids": message_ids[start:start + BATCH_MODIFY_LIMIT],
+                    "addLabelIds": add_label_ids,
+                    "removeLabelIds": remove_label_ids,
+                },
+            )
+            for start in range(0, len(message_ids), BATCH_MODIFY_LIMIT)
+        ]
+
+        if len(requests) == 1:
+            self._call(requests[0].execute)
+        elif requests:
+            self._execute_parallel(requests)
+
+    def _mark_emails_as_read(self, message_ids: List[str]) -> bool:
+        """
+        Marks emails as read by removing the 'UNREAD' label, with one API call per BATCH_MODIFY_LIMIT emails.
+
+        Parameters:
+        message_ids (List[str]): The IDs of the messages to modify.
+
+        Returns:
+        bool: True is successfully marked emails as 'read', else False.
+        """
+        self.logger.debug("Marking %d email(s) as 'READ'.", len(message_ids))
+        try:
+            self._modify_emails(message_ids, add_label_ids=[], remove_label_ids=["UNREAD"])
+            self.logger.debug("Emails marked as 'READ'.")
             return True
         except Exception as e:
-            self.logger.error(f"Failed to mark email as 'READ': {e}")
+            self.logger.error(f"Failed to mark emails as 'READ': {e}")
             return False
-        
-    def _mark_email_as_unread(self, message_id: str) -> bool:
+
+    def _mark_emails_as_unread(self, message_ids: List[str]) -> bool:
         """
-        Marks an email as unread by removing the 'READ' label.
+        Marks emails as unread by adding the 'UNREAD' label, with one API call per BATCH_MODIFY_LIMIT emails.
 
         Parameters:
-        message_id (str): The ID of the message to modify.
+        message_ids (List[str]): The IDs of the messages to modify.
 
         Returns:
-        bool: True is successfully marked email as 'unread', else False.
+        bool: True is successfully marked emails as 'unread', else False.
         """
-        self.logger.debug("Marking email as 'UNREAD'.")
+        self.logger.debug("Marking %d email(s) as 'UNREAD'.", len(message_ids))
         try:
-            self.service.users().messages().modify(
-                userId='me',
-                id=message_id,
-                body={
-                    'removeLabelIds': ['READ'],
-                    'addLabelIds': ['UNREAD']
-                }
-            ).execute()
-            self.logger.debug("Email marked as 'UNREAD'.")
+            self._modify_emails(message_ids, add_label_ids=["UNREAD"], remove_label_ids=[])
+            self.logger.debug("Emails marked as 'UNREAD'.")
             return True
         except Exception as e:
-            self.logger.error(f"Failed to mark email as 'UNREAD': {e}")
+            self.logger.error(f"Failed to mark emails as 'UNREAD': {e}")
             return False
 
+    def _mark_email_as_read(self, message_id: str) -> bool:
+        """
+        Marks an email as read by removing the 'UNREAD' label (see _mark_emails_as_read).
+
+        Parameters:
+        message_id (str): The ID of the message to modify.
+
+        Returns:
+        bool: True is successfully marked email as 'read', else False.
+        """
+        return self._mark_emails_as_read([message_id])
+        
+    def _mark_email_as_unread(self, message_id: str) -> bool:
+        """
+        Marks an email as unread by adding the 'UNREAD' label (see _mark_emails_as_unread).
+
+        Parameters:
+        message_id (str): The ID of the message to modify.
+
+        Returns:
+        bool: True is successfully marked email as 'unread', else False.
+        """
+        return self._mark_emails_as_unread([message_id])
+
 
     def _read_email(self, email: TrackedEmail, parse: bool = False, mark_as_read: bool = False) -> dict | str | None:
         """
@@ -798,33 +1266,51 @@ class GmailService:
             return json.dumps(email_data, indent=4)
         return email_data
 
-    def _read_emails(self, emails: List[TrackedEmail]) -> Generator:
+    def _read_emails(self, emails: Iterable[TrackedEmail]) -> Generator:
         """
-        This function reads and unpacks a list of TrackedEmail objects.
+        This function reads and unpacks TrackedEmail objects, e.g. the deque returned by _get_emails.
 
         Parameters:
-        emails (List[TrackedEmail]): A list of TrackedEmail objects to be unpacked.
+        emails (Iterable[TrackedEmail]): TrackedEmail objects to be unpacked.
 
         Returns:
         Generator: A generator yielding the unpacked email data from each TrackedEmail object.
 
         Raises:
-        GmailEmailError: If the provided emails parameter is not of type List[TrackedEmail].
+        GmailEmailError: If the provided emails parameter is not iterable.
         """
 
         self.logger.debug("Reading multiple emails.")
 
-        if not isinstance(emails, deque):
-            self.logger.exception(f"Emails should be of deque['TrackedEmail'] type, not '{type(emails)}'.")
-            raise GmailEmailError(f"Emails should be of deque['TrackedEmail'] type, not '{type(emails)}'.")
-        
-        self.logger.debug(f"Emails to yield: {len(emails)}")
-        for email in emails:
-            yield email.unpack()
+        if not hasattr(emails, "__iter__"):
+            self.logger.exception(f"Emails should be an iterable of 'TrackedEmail' objects, not '{type(emails)}'.")
+            raise GmailEmailError(f"Emails should be an iterable of 'TrackedEmail' objects, not '{type(emails)}'.")
+
+        return (email.unpack() for email in emails)
+
+    def _read_emails_bulk(self, emails: Iterable[TrackedEmail]) -> List[dict]:
+        """
+        This function unpacks all given TrackedEmail objects at once (see _read_emails).
+
+        Parameters:
+        emails (Iterable[TrackedEmail]): TrackedEmail objects to be unpacked.
+
+        Returns:
+        List[dict]: The unpacked email data of each TrackedEmail object, in order.
+
+        Raises:
+        GmailEmailError: If the provided emails parameter is not iterable.
+        """
+
+        self.logger.debug("Reading multiple emails at once.")
+
+        if not hasattr(emails, "__iter__"):
+            self.logger.exception(f"Emails should be an iterable of 'TrackedEmail' objects, not '{type(emails)}'.")
+            raise GmailEmailError(f"Emails should be an iterable of 'TrackedEmail' objects, not '{type(emails)}'.")
+
+        return list(map(_unpack, emails))
 
 
-    @sleep_and_retry
-    @limits(calls=MAX_API_CALLS, period=API_AWAIT_PERIOD)
     @gmail_api_exceptions
     def _send_email(self, email: MIMEText) -> str:
         """
@@ -844,19 +1330,57 @@ class GmailService:
         """
 
         self.logger.debug("Preparing email to send.")
+        body = self.__raw_body(email)
+        # not retried on 5xx errors: the email may have been sent anyway, and a retry would send it twice
+        message = self._call(self.service.users().messages().send(userId="me", body=body).execute, idempotent=False)
+        self.logger.info("Sent email message id: %s", message["id"])
+        return message["id"]
+
+    @gmail_api_exceptions
+    def _send_emails(self, emails: List[MIMEText]) -> List[str]:
+        """
+        Sends several MIMEText messages concurrently (see _execute_parallel). All messages are validated
+        and serialized before the first one is sent.
+
+        Parameters:
+        emails (List[MIMEText]): The emails to be sent.
+
+        Returns:
+        List[str]: The unique identifiers of the sent messages, in the same order as 'emails'.
+
+        Raises:
+        GmailEmailError: If any of the emails is not a MIMEText.
+        GmailHttpError: If an HTTP error occurs during the API call.
+        GmailApiCallTimeoutError: If the API call times out.
+        GmailPayloadError: If a key is missing in email/data payload.
+        GmailServiceError: If an unhandled exception occurs during the API call.
+        """
+
+        self.logger.debug("Preparing %d email(s) to send.", len(emails))
+        send = self.service.users().messages().send
+        messages = self._execute_parallel([send(userId="me", body=self.__raw_body(email)) for email in emails], idempotent=False)
+        self.logger.info("Sent %d email(s).", len(messages))
+        return [message["id"] for message in messages]
+
+    def __raw_body(self, email: MIMEText) -> dict:
+        """
+        Serializes a MIMEText message into the request body of messages.send.
+
+        Parameters:
+        email (MIMEText): The email to be sent.
+
+        Returns:
+        dict: The request body: {'raw': <base64url encoded message>}.
+
+        Raises:
+        GmailEmailError: If the email is not a MIMEText.
+        """
 
         if not isinstance(email, MIMEText):
             self.logger.exception(f"Email body must be MIMEText type, not '{type(email)}'.")
             raise GmailEmailError(f"Email body must be MIMEText type, not '{type(email)}'.")
-
-        raw_message = base64.urlsafe_b64encode(email.as_bytes()).decode()
-        body = {'raw': raw_message}
-        message = self.service.users().messages().send(userId="me", body=body).execute()
-        self.logger.info(f"Sent email message id: {message['id']}")
-        return message["id"]
+        return {"raw": base64.urlsafe_b64encode(email.as_bytes()).decode("ascii")}
     
-    @sleep_and_retry
-    @limits(calls=MAX_API_CALLS, period=API_AWAIT_PERIOD)
     @gmail_api_exceptions
     def _delete_email(self, email: TrackedEmail) -> str:
         """
@@ -882,22 +1406,20 @@ class GmailService:
             self.logger.exception(f"Email must be a TrackedEmail object, not '{type(email)}'")
             raise ValueError(f"Email must be a TrackedEmail object, not '{type(email)}'")
         
-        message_id = dict(email.unpack())["id"]
-        self.service.users().messages().delete(userId="me",id=message_id).execute()
-        self.logger.debug(f"Deleted email of id: {message_id}")
+        message_id = email.message_id
+        self._call(self.service.users().messages().delete(userId="me",id=message_id).execute)
+        self.logger.debug("Deleted email of id: %s", message_id)
         return message_id
 
 
-    @sleep_and_retry
-    @limits(calls=MAX_API_CALLS, period=API_AWAIT_PERIOD)
     @gmail_api_exceptions
     def _empty_trash(self) -> bool:
         """
         Deletes all emails in the Trash folder.
 
-        This function retrieves all emails with the 'TRASH' label from the Gmail API,
-        and then deletes each email individually. If there are no emails in the Trash folder,
-        the function returns True without any action.
+        This function retrieves the IDs of all emails in the Trash folder (every page of them),
+        and then deletes them with messages.batchDelete, at most BATCH_DELETE_LIMIT emails per API call.
+        If there are no emails in the Trash folder, the function returns True without any action.
 
         Parameters:
         None
@@ -914,24 +1436,30 @@ class GmailService:
 
         self.logger.debug("Deleting all emails from Trash.")
 
-        response = (
-            self.service.users().messages().list(userId="me", labelIds=["TRASH"]).execute()
-        )
-        messages = response.get("messages", [])
+        # all IDs are listed before anything is deleted, so deleting doesn't shift the pages still to be listed
+        message_ids = [
+            message["id"] for messages in self.__retrieve_emails(query="in:trash", max_results=None) for message in messages
+        ]
 
-        if not messages:
+        if not message_ids:
             self.logger.debug("No messages found in Trash.")
             return True
 
-        self.logger.debug(f"Number of messages to delete from Trash: {len(messages)}")
-        for message in messages:
-            self.service.users().messages().delete(userId="me", id=message["id"]).execute()
+        self.logger.debug("Number of messages to delete from Trash: %d", len(message_ids))
+        batch_delete = self.service.users().messages().batchDelete
+        requests = [
+            batch_delete(userId="me", body={"ids": message_ids[start:start + BATCH_DELETE_LIMIT]})
+            for start in range(0, len(message_ids), BATCH_DELETE_LIMIT)
+        ]
+
+        if len(requests) == 1:
+            self._call(requests[0].execute)
+        else:
+            self._execute_parallel(requests)
 
         self.logger.debug("Deleted all messages from Trash.")
         return True
     
-    @sleep_and_retry
-    @limits(calls=MAX_API_CALLS, period=API_AWAIT_PERIOD)
     @gmail_api_exceptions
     def _move_to_folder(
         self, current_label_name: str, destination_label_name: str, message_id: str
@@ -954,161 +1482,264 @@ class GmailService:
         GmailServiceError: If an unhandled exception occurs during the API call.
         """
 
-        self.logger.debug(f"Moving email of id '{message_id}' from '{current_label_name}' to '{destination_label_name}'")
+        self.logger.debug("Moving email of id '%s' from '%s' to '%s'", message_id, current_label_name, destination_label_name)
 
         for check in [message_id, current_label_name, destination_label_name]:
             non_empty_string(check)
 
-        if current_label_name in self.get_labels.keys():
-            if destination_label_name not in self.get_labels.keys():
-                self.create_label(destination_label_name)
-                self.logger.debug(f"'{destination_label_name} folder created (did not exist)")
-
-            self.service.users().messages().modify(
-                userId="me",
-                id=message_id,
-                body={
-                    "removeLabelIds": [self.get_labels[current_label_name]],
-                    "addLabelIds": [self.get_labels[destination_label_name]],
-                },
-            ).execute()
-            self.logger.debug(f"Email of if '{message_id}' successfully moved from '{current_label_name}' to '{destination_label_name}'")
+        # the internal label dictionary is kept up to date by _create_labels/_delete_labels, no API call is needed to read it
+        labels = self.__labels
+
+        if current_label_name in labels:
+            if destination_label_name not in labels:
+                self._create_label(destination_label_name)
+                self.logger.debug("'%s' folder created (did not exist)", destination_label_name)
+
+            self._call(
+                self.service.users().messages().modify(
+                    userId="me",
+                    id=message_id,
+                    body={
+                        "removeLabelIds": [labels[current_label_name]],
+                        "addLabelIds": [labels[destination_label_name]],
+                    },
+                ).execute
+            )
+            self.logger.debug("Email of id '%s' successfully moved from '%s' to '%s'", message_id, current_label_name, destination_label_name)
             return True
         self.logger.error(f"Failed to move email of id '{message_id}' from '{current_label_name}' to '{destination_label_name}'")
         return False
 
-    @sleep_and_retry
-    @limits(calls=MAX_API_CALLS, period=API_AWAIT_PERIOD)
-    @gmail_api_exceptions
-    def __retrieve_emails(self, query: str = "is:unread in:inbox", filters: dict = None, max_results: int = 10, page_token: int = None, fields: str = "messages") -> List[tuple]:
+    def __retrieve_emails(
+            self,
+            query: str = "is:unread in:inbox",
+            filters: dict = None,
+            max_results: int = 10,
+            page_token: str = None,
+            fields: str = "messages/id,nextPageToken"
+        ) -> Generator[List[dict], None, None]:
         """
-        Retrieves emails from the Gmail account based on the provided custom filter.
-        Example return data:
+        Retrieves emails from the Gmail account based on the provided custom filter, page by page.
+        The next page is requested (with 'nextPageToken') only when the previous one has been consumed.
+        Example page (only message IDs are requested by default):
             [
-                {'id': '191c84f310aca74c', 'threadId': '191c84f310aca74c'},
-                {'id': '191c830f05f2ffa9', 'threadId': '191c830f05f2ffa9'}
+                {'id': '191c84f310aca74c'},
+                {'id': '191c830f05f2ffa9'}
             ]
 
         Parameters:
         query (str): If filter is not provided, a simple query is made to set the retrieved messages scope. "is:unread in:inbox" by default.
         filters (dict, optional): A dictionary representing a custom filter to be applied to the email retrieval. Defaults to None.
         max_results (int): Maximum number of results of fetched emails. DESC by default. Set None to get all emails.
-        page_token (int): Token for pagination (set to None for the first page).
-        fields (str): Custom query to call specific range of messages. All returned by default.
+        page_token (str): Token of the page to start from (set to None for the first page).
+        fields (str): Custom query to call specific range of messages. Must include 'nextPageToken' to get more than one page.
+                      "messages/id,nextPageToken" by default, since the messages are fetched by ID afterwards.
 
         Returns:
-        List[tuple]: A list of tuples, where each tuple represents an email with the following structure: {'id': 'email_id', 'threadId': 'email_thread_id'}.
+        Generator[List[dict], None, None]: Non-empty pages of emails, each a list of dicts with the following structure: {'id': 'email_id'}.
 
         Raises:
-        GmailHttpError: If an HTTP error occurs during the API call.
-        GmailApiCallTimeoutError: If the API call times out.
-        GmailPayloadError: If a key is missing in email/data payload.
-        GmailServiceError: If an unhandled exception occurs during the API call.
+        HttpError: While iterating, if an HTTP error occurs during the API call.
         """
 
         self.logger.debug("Retrieving emails.")
 
         if filters:
-            result = (
+            result = self._call(
                 self.service.users()
                 .settings()
                 .filters()
                 .create(userId="me", body=filters)
-                .execute()
+                .execute
             )
-        else:
-            result = (
+            messages = result.get("messages", [])
+            if messages:
+                yield messages
+            return
+
+        remaining = max_results
+        while True:
+            result = self._call(
                 self.service.users()
                 .messages()
                 .list(
                     userId="me", 
                     q=query,
-                    maxResults=max_results,
+                    maxResults=min(remaining, MAX_LIST_PAGE_SIZE) if remaining else MAX_LIST_PAGE_SIZE,
                     pageToken=page_token,
-                    fields=fields  # 'messages' = all fields by default
+                    fields=fields
                 )
-                .execute()
+                .execute
             )
-        return result.get("messages", [])
+            messages = result.get("messages", [])
+
+            if remaining:
+                messages = messages[:remaining]
+                remaining -= len(messages)
+
+            if messages:
+                yield messages
 
+            page_token = result.get("nextPageToken")
+            if not page_token or remaining == 0:
+                return
 
-    def __extract_custom_email(self, msg: dict, links_type: LinksType, store_headers: bool) -> dict:
+
+    def __email_extractor(self, links_type: LinksType, store_headers: bool) -> Callable[[dict], dict]:
         """
-        Extracts custom email data from the provided message dictionary.
+        Builds the function extracting custom email data from a message dictionary, specialized once for the
+        'links_type' and 'store_headers' preferences of a _get_emails call instead of checking them for every message.
 
         Parameters:
-        msg (dict): The message dictionary containing email data.
         links_type (LinksType): The preference for adding links to the email payload.
         store_headers (bool): A flag indicating whether to store email headers in the payload.
 
         Returns:
-        dict: A dictionary containing the extracted custom email data.
+        Callable[[dict], dict]: A function taking the message dictionary and returning the extracted custom email data.
+        It raises GmailPayloadError if a key is missing in email/data payload and GmailServiceError on any other error.
+        """
+
+        self.logger.debug("Extracting emails. Links type: %s Store headers: %s", links_type, store_headers)
+        logger = self.logger
+        with_links = links_type != LinksType.NONE
+
+        def extract(msg: dict) -> dict:
+            try:
+                if "payload" not in msg:
+                    logger.error("No messages found.")
+                    return {}
+
+                message_template = {**MESSAGE_TEMPLATE, "links": {"number": 0, "href": []}}
+
+                email_data = msg["payload"].get("headers")
+                if email_data is not None:
+                    message_template = email_basic_information(email_data, message_template, logger)
+                else:
+                    logger.warning("Missing headers in email. Failed to get basic sender-recipient information")
+
+                message_template, links = email_message_from_partial(msg, message_template, logger)
+
+                if with_links:
+                    message_template = add_links(links, links_type, message_template, logger)
+
+                message_template["message"] = clean_message(message_template["message"])
+
+                if store_headers:
+                    message_template["headres"] = email_data
+
+                return message_template
+            except KeyError as e:
+                logger.exception(f"Failed to extract email data. Key Error: {e}")
+                raise GmailPayloadError(f"{e}")
+            except Exception as e:
+                logger.exception(f"Failed to extract email data: {e}")
+                raise GmailServiceError(f"{e}")
+
+        return extract
+
+    def _store_email(self, msg: dict, message_template: dict) -> None:
+        """
+        Stores a fetched email as a TrackedEmail and appends its fields to the column view (see _as_dataframe).
+        Label IDs and sender addresses repeat heavily across a mailbox, so they are interned and shared.
+
+        Parameters:
+        msg (dict): The message resource returned by the Gmail API.
+        message_template (dict): The processed email data, stored as the TrackedEmail payload.
+
+        Returns:
+        None
 
         Raises:
-        GmailPayloadError: If a key is missing in email/data payload.
-        GmailServiceError: If an unhandled exception occurs during the API call.
+        KeyError: If 'id', 'threadId' or 'labelIds' is missing in the message.
         """
 
-        self.logger.debug(f"Extracting emails. Links type: {links_type.value} Store headers: {store_headers}")
+        labels = [intern(label) for label in msg["labelIds"]]
+        senders = message_template.get("from")
+        if senders:
+            senders = [intern(sender) for sender in senders]
+            message_template["from"] = senders
+
+        self._emails.append(
+            TrackedEmail(
+                id_=msg["id"],
+                thread=msg["threadId"],
+                labels=labels,
+                payload=message_template,
+                logger=self.logger,
+            )
+        )
 
-        try:
+        columns = self._email_columns
+        columns["id"].append(msg["id"])
+        columns["thread_id"].append(msg["threadId"])
+        columns["from"].append(senders)
+        columns["to"].append(message_template.get("to"))
+        columns["subject"].append(message_template.get("subject"))
+        columns["internal_date"].append(msg.get("internalDate"))
+        columns["snippet"].append(msg.get("snippet"))
+        columns["label_ids"].append(labels)
+
+    def _as_dataframe(self):
+        """
+        Returns the fetched emails as a pandas DataFrame with one column per field of EMAIL_COLUMNS,
+        built from the column view without copying the stored values. Requires the optional 'pandas' package.
 
-            if "payload" not in msg.keys():
-                self.logger.error("No messages found.")
-                return {}
+        Parameters:
+        None
 
-            message_template = {
-                "from": None,
-                "to": None,
-                "subject": None,
-                "message": "",
-                "links": {"number": 0, "href": []},
-            }
+        Returns:
+        pandas.DataFrame: One row per fetched email, in fetch order.
 
-            links: list = []
+        Raises:
+        ImportError: If pandas is not installed.
+        """
 
-            if "headers" in msg["payload"]:
-                email_data = msg["payload"]["headers"]
-                message_template = email_basic_information(email_data, message_template, self.logger)
-            else:
-                self.logger.warning("Missing headers in email. Failed to get basic sender-recipient information")
+        try:
+            import pandas
+        except ImportError:
+            self.logger.exception("The 'pandas' package is required to build a DataFrame: pip install pandas")
+            raise ImportError("The 'pandas' package is required to build a DataFrame: pip install pandas")
 
-            if "parts" in msg["payload"]:
-                message_template, links = email_message_from_partial(
-                    msg, message_template, self.logger
-                )
+        return pandas.DataFrame(self._email_columns, copy=False)
 
-            if links_type.value:
-                message_template = add_links(
-                    links, links_type.value, message_template, self.logger
-                )
+    @gmail_api_exceptions
+    def _batch_get_messages(self, ids: List[str], format: str = "full", fields: Optional[str] = None) -> List[dict]:
+        """
+        Fetches several messages through the batch endpoint, _BATCH_LIMIT messages per batch request.
+        Every batch request is a single rate-limited API call; when there is more than one, they are sent
+        concurrently on the executor, each worker with its own transport (see _thread_http).
 
-            self.logger.debug("Cleaning email message text from unicode characters.")
-            message_template["message"] = remove_unicode(message_template["message"])
-            message_template["message"] = clean_text(message_template["message"])
+        Parameters:
+        ids (List[str]): The unique identifiers of the messages to be fetched.
+        format (str): The format of the returned messages: "full", "metadata", "minimal" or "raw". "full" by default.
+        fields (Optional[str]): A partial response selector, e.g. MESSAGE_FIELDS. All fields are returned by default.
 
-            if store_headers:
-                self.logger.debug("Adding headers information.")
-                message_template["headres"] = email_data
+        Returns:
+        List[dict]: The message resources, in the same order as 'ids'.
 
-            return message_template
-        except KeyError as e:
-            self.logger.exception(f"Failed to extract email data. Key Error: {e}")
-            raise GmailPayloadError(f"{e}")
-        except Exception as e:
-            self.logger.exception(f"Failed to extract email data: {e}")
-            raise GmailService(f"{e}")
-        
+        Raises:
+        GmailHttpError: If an HTTP error occurs during the API call.
+        GmailApiCallTimeoutError: If the API call times out.
+        GmailPayloadError: If a key is missing in email/data payload.
+        GmailServiceError: If an unhandled exception occurs during the API call.
+        """
 
-    @sleep_and_retry
-    @limits(calls=MAX_API_CALLS, period=API_AWAIT_PERIOD)
-    @gmail_api_exceptions
-    def __get_message(self, message_id: str):
-        self.logger.debug(f"Requesting data for email of id: {message_id}")
-        return self.service.users().messages().get(userId="me", id=message_id).execute()
+        self.logger.debug("Requesting data for %d email(s).", len(ids))
+
+        if len(ids) <= _BATCH_LIMIT:
+            return self._call(lambda: get_messages(ids, self.service, self.logger, format=format, fields=fields))
+
+        futures = [
+            self._executor.submit(
+                self._call_limited,
+                lambda chunk=ids[start:start + _BATCH_LIMIT]: get_messages(
+                    chunk, self.service, self.logger, format=format, http=self._thread_http(), fields=fields
+                )
+            )
+            for start in range(0, len(ids), _BATCH_LIMIT)
+        ]
+        return [msg for future in futures for msg in future.result()]
 
-    @sleep_and_retry
-    @limits(calls=MAX_API_CALLS, period=API_AWAIT_PERIOD)
     @gmail_api_exceptions
     def _get_emails(
         self,
@@ -1119,7 +1750,8 @@ class GmailService:
         raw: bool = False,
         filters: Optional[dict] = None,
         return_attachments: bool = False, 
-        attachment_file_path: str = None
+        attachment_file_path: str = None,
+        attachment_callback: Optional[Callable[[bytes, dict], None]] = None
     ) -> deque[TrackedEmail]:
         """
         Retrieves and processes emails from the Gmail account based on the provided preferences.
@@ -1137,6 +1769,8 @@ class GmailService:
         return_attachments (bool): If True then search for email attachments and return them as raw data (bytes/strs). False by default.
         attachment_file_path (str): a path where attachments should be downloaded. If such directory does not exist, create it and grant 755 permissions.
                                     If 'attachment_file_path' provided, then search for attachments and download them locally. None by default.
+        attachment_callback (Callable[[bytes, dict], None]): If provided, search for attachments and call it with the decoded data and the message part
+                                                             of every attachment as soon as it is downloaded. None by default.
 
         Returns:
         List[TrackedEmail]: A list containing the processed email data stored as TrackedEmail objects.
@@ -1152,45 +1786,45 @@ class GmailService:
 
         try:
             max_results = verify_limit(max_results)
-            messages = self.__retrieve_emails(query=query, filters=filters, max_results=max_results )
+            found = 0
+            # raw messages are returned as they are, so only they need every field of the resource
+            fields = None if raw else MESSAGE_FIELDS
+            extract_email = None if raw else self.__email_extractor(links_type, store_headers)
+            debug = self.logger.isEnabledFor(logging.DEBUG)  # checked once, not for every message
 
-            if not messages:  
+            # every page is fetched and processed before the next one is listed, so only one page of messages is held at a time
+            try:
+                for messages in self.__retrieve_emails(query=query, filters=filters, max_results=max_results):
+                    self.logger.debug("Searching for %d message(s).", len(messages))
+                    found += len(messages)
+
+                    msgs = self._batch_get_messages([message["id"] for message in messages], fields=fields)
+
+                    for message, msg in zip(messages, msgs):
+                        if raw:
+                            if debug:
+                                self.logger.debug("Getting raw message.")
+                            # the only change made to the template is the top-level 'attachments' key, so a shallow copy keeps msg intact
+                            message_template = dict(msg)
+                        else:
+                            if debug:
+                                self.logger.debug("Getting structured message.")
+                            message_template = extract_email(msg)
+                        
+                        if return_attachments or attachment_file_path or attachment_callback:
+                            if debug:
+                                self.logger.debug("Seaerching for attachments.")
+                            message_template["attachments"] = self.__get_attachments(msg=msg, message=message, return_attachments=return_attachments, download_path=attachment_file_path, callback=attachment_callback)
+
+                        self._store_email(msg, message_template)
+            finally:
+                # attachments queued on the writer thread are saved before the emails are returned
+                self._wait_for_writes()
+
+            if not found:  
                 self.logger.debug("No messages found.")
                 return []
-
-            self.logger.debug(f"Searching for {len(messages)} message(s).")
-
-            for message in messages:
-                msg = (
-                    self.service.users()
-                    .messages()
-                    .get(userId="me", id=message["id"])
-                    .execute()
-                )
-
-                if raw:
-                    self.logger.debug("Getting raw message.")
-                    message_template = json.loads(
-                        json.dumps(self.__get_message(message_id=message["id"]), indent=4)
-                    )
-                else:
-                    self.logger.debug("Getting structured message.")
-                    message_template = self.__extract_custom_email(msg, links_type, store_headers)
-                    
-                if return_attachments or attachment_file_path:
-                    self.logger.debug("Seaerching for attachments.")
-                    message_template["attachments"] = self.__get_attachments(msg=msg, message=message, return_attachments=return_attachments, download_path=attachment_file_path)
-
-                self._emails.append(
-                    TrackedEmail(
-                        id_=msg["id"],
-                        thread=msg["threadId"],
-                        labels=msg["labelIds"],
-                        payload=message_template,
-                        logger=self.logger,
-                    )
-                )
-            self.logger.debug(f"Found {len(self._emails)} email(s) in total.")
+            self.logger.debug("Found %d email(s) in total.", len(self._emails))
             return self._emails
         except KeyError as e:
             self.logger.exception(f"Failed to get emails due to error key: {e}")
@@ -1200,8 +1834,6 @@ class GmailService:
             raise GmailEmailError(f"Failed to get emails: {e}")
         
     
-    @sleep_and_retry
-    @limits(calls=MAX_API_CALLS, period=API_AWAIT_PERIOD)
     @gmail_api_exceptions
     def _connect(self):
         """
@@ -1228,6 +1860,9 @@ class GmailService:
         build... (the stablished connection) is of class from googleapiclient.discovery import Resource
         """
         self.logger.info("Connecting to Gmail API service.")
-        self.credentials = load_token(self.token_file)
         self.__check_token()
-        return build("gmail", "v1", credentials=self.credentials)
+        # one explicit keep-alive transport for the calls made from this thread (executor workers use _thread_http);
+        # the discovery document is read from the copy bundled with google-api-python-client, never downloaded
+        http = AuthorizedHttp(self.credentials, http=httplib2.Http(timeout=HTTP_TIMEOUT))
+        self._transports.append(http)
+        return self._call(lambda: build("gmail", "v1", http=http, cache_discovery=False, static_discovery=True))
@@ -0,0 +1,367 @@
+# https://github.com/pyautoml/GmailPy
+
+import random
+import threading
+from logging import Logger
+from time import monotonic, sleep
+from typing import Any, Callable, Final, Optional
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+from googleapiclient.errors import HttpError
+
+
+"""
+This module provides client-side rate limiting for Gmail API calls.
+
+TokenBucket optionally paces the calls of a single GmailService instance: 'rate' calls are allowed per 'per' seconds,
+with bursts of up to 'rate' calls. call_with_backoff() takes a token before every attempt (if a bucket is given)
+and retries calls rejected with HTTP 429, a 403 rate limit error or a transient 5xx error. It honours the
+'Retry-After' header (plus RETRY_AFTER_MARGIN) when Gmail sends one and backs off exponentially (with jitter) otherwise,
+so calls that are never throttled never wait. When a call is throttled, the Cooldown shared by the instance
+pauses all of its calls for the same delay, instead of letting the other threads keep hitting the exhausted quota.
+AdaptiveLimit bounds the number of concurrent calls with an AIMD controller, as in TCP congestion control:
+the limit grows by one after a full round of successful calls and is halved when a call is throttled.
+
+[Links]: Gmail API usage limits: https://developers.google.com/gmail/api/reference/quota
+"""
+
+RETRY_STATUSES: Final[frozenset] = frozenset({429, 500, 502, 503})
+RATE_LIMIT_REASONS: Final[tuple] = (b"rateLimitExceeded", b"userRateLimitExceeded")  # sent by Gmail with HTTP 403
+MAX_ATTEMPTS: Final[int] = 5
+BACKOFF_BASE: Final[float] = 1.0
+BACKOFF_CAP: Final[float] = 60.0
+BACKOFF_JITTER: Final[float] = 2.0
+RETRY_AFTER_MARGIN: Final[float] = 1.0
+DECREASE_FACTOR: Final[float] = 0.5
+
+
+class TokenBucket:
+    """
+    A thread-safe token bucket. Every call takes one token; tokens are refilled continuously
+    at 'rate' tokens per 'per' seconds, and the bucket holds at most 'rate' tokens.
+    """
+
+    __slots__ = ("rate", "per", "_tokens", "_updated", "_lock")
+
+    def __init__(self, rate: int, per: float) -> None:
+        """
+        Initializes a full token bucket.
+
+        Parameters:
+        rate (int): The number of calls allowed per period. Also the burst size.
+        per (float): The period in seconds.
+
+        Raises:
+        ValueError: If 'rate' or 'per' is not a positive number.
+        """
+
+        if not rate > 0 or not per > 0:
+            raise ValueError(f"'rate' and 'per' must be positive, not '{rate}' and '{per}'")
+
+        self.rate = rate
+        self.per = per
+        self._tokens = float(rate)
+        self._updated = monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """
+        Takes one token, sleeping until it is available. The token is reserved under the lock and the
+        caller sleeps outside of it, so concurrent callers queue up without blocking each other.
+
+        Parameters:
+        None
+
+        Returns:
+        float: The time in seconds the caller waited.
+        """
+
+        with self._lock:
+            now = monotonic()
+            self._tokens = min(self.rate, self._tokens + (now - self._updated) * self.rate / self.per)
+            self._updated = now
+            self._tokens -= 1
+            wait = -self._tokens * self.per / self.rate if self._tokens < 0 else 0.0
+
+        if wait:
+            sleep(wait)
+        return wait
+
+
+class Cooldown:
+    """
+    A thread-safe pause shared by all calls of one GmailService instance. Once Gmail throttles a call,
+    every call waits until the pause is over before it is sent.
+    """
+
+    __slots__ = ("_until", "_lock")
+
+    def __init__(self) -> None:
+        """
+        Initializes an inactive cooldown.
+
+        Parameters:
+        None
+        """
+
+        self._until = 0.0
+        self._lock = threading.Lock()
+
+    def pause(self, seconds: float) -> None:
+        """
+        Pauses all calls for 'seconds', unless they are already paused for longer.
+
+        Parameters:
+        seconds (float): The length of the pause in seconds.
+
+        Returns:
+        None
+        """
+
+        with self._lock:
+            self._until = max(self._until, monotonic() + seconds)
+
+    def wait(self) -> float:
+        """
+        Sleeps until the current pause is over.
+
+        Parameters:
+        None
+
+        Returns:
+        float: The time in seconds the caller waited.
+        """
+
+        with self._lock:
+            wait = self._until - monotonic()
+
+        if wait > 0:
+            sleep(wait)
+            return wait
+        return 0.0
+
+
+class AdaptiveLimit:
+    """
+    A thread-safe, self-adjusting limit of concurrent calls (additive increase, multiplicative decrease).
+    The limit grows by one after 'limit' successful calls in a row and is multiplied by DECREASE_FACTOR
+    when a call is throttled, staying between 'minimum' and 'maximum'.
+    """
+
+    __slots__ = ("limit", "minimum", "maximum", "epoch", "_active", "_successes", "_condition")
+
+    def __init__(self, initial: int, minimum: int, maximum: int) -> None:
+        """
+        Initializes the limit.
+
+        Parameters:
+        initial (int): The initial number of concurrent calls.
+        minimum (int): The lowest allowed limit.
+        maximum (int): The highest allowed limit, e.g. the size of the pool running the calls.
+
+        Raises:
+        ValueError: If the values are not positive, or 'initial' is not between 'minimum' and 'maximum'.
+        """
+
+        if not 0 < minimum <= initial <= maximum:
+            raise ValueError(f"Expected 0 < minimum <= initial <= maximum, got '{minimum}', '{initial}' and '{maximum}'")
+
+        self.limit = initial
+        self.minimum = minimum
+        self.maximum = maximum
+        self.epoch = 0  # bumped on every decrease, so a burst of throttled calls decreases the limit only once
+        self._active = 0
+        self._successes = 0
+        self._condition = threading.Condition()
+
+    def acquire(self) -> int:
+        """
+        Takes a slot, waiting until fewer than 'limit' calls are active.
+
+        Parameters:
+        None
+
+        Returns:
+        int: The current epoch, to be passed to on_throttle().
+        """
+
+        with self._condition:
+            while self._active >= self.limit:
+                self._condition.wait()
+            self._active += 1
+            return self.epoch
+
+    def release(self) -> None:
+        """
+        Frees a slot taken by acquire().
+
+        Parameters:
+        None
+
+        Returns:
+        None
+        """
+
+        with self._condition:
+            self._active -= 1
+            self._condition.notify()
+
+    def on_success(self) -> None:
+        """
+        Records a successful call. A full round of them ('limit' calls) raises the limit by one.
+
+        Parameters:
+        None
+
+        Returns:
+        None
+        """
+
+        with self._condition:
+            self._successes += 1
+            if self._successes >= self.limit and self.limit < self.maximum:
+                self.limit += 1
+                self._successes = 0
+                self._condition.notify()
+
+    def on_throttle(self, epoch: int) -> None:
+        """
+        Records a throttled call and decreases the limit, unless it was already decreased after the call started.
+
+        Parameters:
+        epoch (int): The epoch returned by acquire() for the throttled call.
+
+        Returns:
+        None
+        """
+
+        with self._condition:
+            self._successes = 0
+            if epoch == self.epoch:
+                self.limit = max(self.minimum, int(self.limit * DECREASE_FACTOR))
+                self.epoch += 1
+
+
+def retry_after(error: HttpError) -> Optional[float]:
+    """
+    Reads the 'Retry-After' header of a failed response.
+
+    Parameters:
+    error (HttpError): The error raised by the Gmail API client.
+
+    Returns:
+    Optional[float]: The number of seconds to wait, or None if the header is missing or invalid.
+    """
+
+    resp = getattr(error, "resp", None)
+    value = resp.get("retry-after") if resp is not None else None
+
+    if not value:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        return max(0.0, (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds())
+    except (TypeError, ValueError):
+        return None
+
+
+def is_throttled(error: HttpError) -> bool:
+    """
+    Checks if a failed call was rejected by the Gmail rate limits: HTTP 429, or HTTP 403 with a rate limit reason.
+
+    Parameters:
+    error (HttpError): The error raised by the Gmail API client.
+
+    Returns:
+    bool: True if the call was throttled.
+    """
+
+    status = getattr(getattr(error, "resp", None), "status", None)
+
+    if status == 429:
+        return True
+
+    if status == 403:
+        content = getattr(error, "content", None) or b""
+        return any(reason in content for reason in RATE_LIMIT_REASONS)
+    return False
+
+
+def is_retryable(error: HttpError) -> bool:
+    """
+    Checks if a failed call is worth retrying: it was throttled (see is_throttled) or failed with a transient server error.
+
+    Parameters:
+    error (HttpError): The error raised by the Gmail API client.
+
+    Returns:
+    bool: True if the call should be retried.
+    """
+
+    return getattr(getattr(error, "resp", None), "status", None) in RETRY_STATUSES or is_throttled(error)
+
+
+def call_with_backoff(
+        func: Callable[[], Any],
+        bucket: Optional[TokenBucket],
+        logger: Logger,
+        max_attempts: int = MAX_ATTEMPTS,
+        base: float = BACKOFF_BASE,
+        cap: float = BACKOFF_CAP,
+        jitter: float = BACKOFF_JITTER,
+        cooldown: Optional[Cooldown] = None,
+        idempotent: bool = True
+    ) -> Any:
+    """
+    Calls 'func' once a token is available, retrying it on rate limit and transient 5xx errors (see is_retryable).
+    A non-idempotent call is retried on rate limit errors only (see is_throttled).
+
+    Parameters:
+    func (Callable[[], Any]): The API call, e.g. a prepared request's 'execute' method.
+    bucket (Optional[TokenBucket]): The bucket every attempt takes a token from. If None, calls are not paced.
+    max_attempts (int): The maximum number of attempts, including the first one.
+    base (float): The delay in seconds before the first retry, doubled for every next one.
+    cap (float): The maximum exponential delay in seconds.
+    jitter (float): The maximum random delay in seconds added to the exponential delay.
+    cooldown (Optional[Cooldown]): The pause shared with the other calls. Every attempt waits for it, and a throttled
+                                   attempt pauses it for the retry delay. If None, only the throttled call waits.
+    idempotent (bool): False for calls that must not run twice, e.g. sending an email: a 5xx response doesn't prove
+                       the call had no effect, while a throttled call was rejected before it was processed.
+
+    Returns:
+    Any: The result of 'func'.
+
+    Raises:
+    HttpError: If the call failed with a non-retryable status, or the last attempt failed.
+    """
+
+    for attempt in range(max_attempts):
+        if cooldown is not None:
+            cooldown.wait()
+        if bucket is not None:
+            bucket.acquire()
+        try:
+            return func()
+        except HttpError as e:
+            retryable = is_retryable(e) if idempotent else is_throttled(e)
+            if attempt + 1 >= max_attempts or not retryable:
+                raise
+
+            status = getattr(getattr(e, "resp", None), "status", None)
+            delay = retry_after(e)
+            if delay is None:
+                delay = min(cap, base * 2 ** attempt) + random.uniform(0, jitter)
+            else:
+                delay += RETRY_AFTER_MARGIN
+
+            logger.warning("Gmail API responded with %s, retrying in %.2f s (%d/%d).", status, delay, attempt + 1, max_attempts - 1)
+
+            if cooldown is not None and is_throttled(e):
+                cooldown.pause(delay)  # waited out at the start of the next attempt, by every caller
+            else:
+                sleep(delay)
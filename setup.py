@@ -31,7 +31,6 @@ setup(
     packages=find_packages(where='src'),
     package_dir={'': 'src'},
     install_requires=[
-        "bs4==0.0.2",
         "email-validator==2.2.0",
         "google-api-core==2.19.2",
         "google-api-python-client==2.144.0",
@@ -39,9 +38,12 @@ setup(
         "google-auth-httplib2==0.2.0",
         "google-auth-oauthlib==1.2.1",
         "googleapis-common-protos==1.65.0",
+        "selectolax==0.3.21",
         "setuptools==74.0.0",
         "termcolor==2.4.0",
-        "setuptools==74.0.0",
         "wheel==0.44.0"
-    ]
+    ],
+    extras_require={
+        "fast": ["hyperscan==0.9.1", "orjson==3.10.7"]
+    }
 )
\ No newline at end of file
@@ -1,10 +1,12 @@
 # https://github.com/pyautoml/GmailPy
 
+from collections import ChainMap
 from string import Template
 
 
 """
-This module contains several pre-defined email templates, each represented by a Template object from the string module. 
+This module contains several pre-defined email templates, each represented by a PreparedTemplate object:
+a Template from the string module that is parsed only once, when it is created (see PreparedTemplate). 
 These templates can be used to generate personalized email content based on specific variables.
 
 Usage example:
@@ -29,7 +31,75 @@ Usage example:
 """
 
 
-emails_sumup_template = Template("""
+class PreparedTemplate(Template):
+    """
+    A string.Template parsed once, when it is created: substitute() fills a str.format() string built from the template,
+    instead of running the Template regex over the whole text on every call. Other methods (e.g. safe_substitute) are inherited.
+    """
+
+    def __init__(self, template: str) -> None:
+        """
+        Initializes the template and prepares its str.format() form.
+
+        Parameters:
+        template (str): The template text, with $name / ${name} placeholders and $$ for a literal '$'.
+        """
+
+        super().__init__(template)
+        self._format = self._prepare(template)
+
+    def _prepare(self, template: str) -> str | None:
+        """
+        Converts the template to a str.format() string.
+
+        Parameters:
+        template (str): The template text.
+
+        Returns:
+        str: The template with {name} placeholders and literal braces doubled.
+        None: If the template has an invalid placeholder, so substitute() raises the usual ValueError.
+        """
+
+        parts = []
+        last = 0
+        for match in self.pattern.finditer(template):
+            parts.append(template[last:match.start()].replace("{", "{{").replace("}", "}}"))
+            last = match.end()
+            if match.group("invalid") is not None:
+                return None
+            if match.group("escaped") is not None:
+                parts.append(self.delimiter)
+            else:
+                parts.append("{" + (match.group("named") or match.group("braced")) + "}")
+        parts.append(template[last:].replace("{", "{{").replace("}", "}}"))
+        return "".join(parts)
+
+    def substitute(self, mapping=None, /, **kws) -> str:
+        """
+        Substitutes the placeholders, with the same arguments and errors as string.Template.substitute.
+
+        Parameters:
+        mapping (Mapping, optional): The placeholder values.
+        **kws: The placeholder values, taking precedence over 'mapping'.
+
+        Returns:
+        str: The filled template.
+
+        Raises:
+        KeyError: If a placeholder has no value.
+        ValueError: If the template has an invalid placeholder.
+        """
+
+        if self._format is None:
+            return super().substitute(mapping, **kws) if mapping is not None else super().substitute(**kws)
+        if mapping is None:
+            mapping = kws
+        elif kws:
+            mapping = ChainMap(kws, mapping)
+        return self._format.format_map(mapping)
+
+
+emails_sumup_template = PreparedTemplate("""
 Hi ${recipient_name},
 
 Here's a summary of your mailbox content for the last week:
@@ -46,7 +116,7 @@ ${assistant}
 """)
 
 
-holiday_template = Template("""
+holiday_template = PreparedTemplate("""
 Hello,
 
 Thank you for your email. I am currently out of the office for the ${holiday_name} holiday from ${start_date} to ${end_date}.
@@ -56,7 +126,7 @@ Best wishes,
 ${your_name}
 """)
 
-assistant_template = Template("""
+assistant_template = PreparedTemplate("""
 Dear ${user_name},
 
 I'm your new AI-powered email assistant. I'm here to help you manage your inbox more efficiently. Here are some ways I can assist you:
@@ -73,7 +143,7 @@ Your Personal Assistant
 """)
 
 
-meeting_request_template = Template("""
+meeting_request_template = PreparedTemplate("""
 Dear ${recipient_name},
 
 I hope this email finds you well. I would like to schedule a meeting to discuss ${meeting_subject}.
@@ -89,7 +159,7 @@ Best regards,
 ${your_name}
 """)
 
-newsletter_template = Template("""
+newsletter_template = PreparedTemplate("""
 Dear ${subscriber_name},
 
 Welcome to our ${month_year} newsletter! Here are the highlights:
@@ -0,0 +1,24 @@
+# https://github.com/pyautoml/GmailPy
+
+import base64
+from ..email_sections import email_message_from_partial
+
+
+def _plain_message(body: str) -> dict:
+    data = base64.urlsafe_b64encode(body.encode("utf-8")).decode("ascii")
+    return {"payload": {"mimeType": "text/plain", "body": {"data": data}}}
+
+
+def test_plain_text_keeps_text_after_angle_bracket():
+    message, links = email_message_from_partial(_plain_message("if a<b then see https://foo.io/x ok"), {"message": ""})
+
+    assert message["message"] == "if a<b then see  ok"
+    assert links == ["https://foo.io/x"]
+
+
+def test_plain_text_collects_autolinks():
+    message, links = email_message_from_partial(
+        _plain_message("see <https://example.com/a?b=1> and https://foo.io/x."), {"message": ""}
+    )
+
+    assert links == ["https://example.com/a?b=1", "https://foo.io/x."]
@@ -0,0 +1,26 @@
+# https://github.com/pyautoml/GmailPy
+
+import json
+import pytest
+from .. import utils
+from ..email_tracker import TrackedEmail
+from ..utils import dump_json_bytes
+
+
+def _tracked_email() -> TrackedEmail:
+    payload = {"subject": "żółw", "links": ["https://a.io"], "nested": {"empty": [], "size": 3}}
+    return TrackedEmail("id-1", "thread-1", ["INBOX"], payload)
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_document_bytes_round_trips_to_unpack(monkeypatch, use_orjson):
+    if not use_orjson:
+        monkeypatch.setattr(utils, "orjson", None)
+    elif utils.orjson is None:
+        pytest.skip("orjson is not installed")
+    email = _tracked_email()
+
+    document = email._document_bytes()
+
+    assert json.loads(document) == email.unpack()
+    assert document == dump_json_bytes(email.unpack())
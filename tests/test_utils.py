@@ -0,0 +1,74 @@
+# https://github.com/pyautoml/GmailPy
+
+import base64
+import pytest
+from email import message_from_bytes, policy
+from .. import utils
+from ..utils import dump_json_bytes, encode_raw_message, exec_callable, validate_email_, validate_bulk_emails
+
+
+def test_validate_email_accepts_unicode_local_part():
+    assert validate_email_("josé@example.com")
+
+
+def test_validate_email_rejects_malformed_addresses():
+    for email in ("a..b@x..com", ".a@b.co", "a@-x.com"):
+        assert not validate_email_(email), email
+
+
+def test_validate_bulk_emails_keeps_only_valid_addresses():
+    emails = ["josé@example.com", "a..b@x..com", ".a@b.co", "a@-x.com", "john.doe+tag@mail.example.co.uk"]
+
+    assert validate_bulk_emails(emails) == ["josé@example.com", "john.doe+tag@mail.example.co.uk"]
+    assert validate_bulk_emails(emails, strict=True) == ["josé@example.com", "john.doe+tag@mail.example.co.uk"]
+
+
+def test_validate_bulk_emails_strict_uses_email_validator():
+    # passes the pattern, but the domain label is longer than 63 characters
+    email = f"a@{'x' * 64}.com"
+
+    assert validate_bulk_emails([email]) == [email]
+    assert validate_bulk_emails([email], strict=True) == []
+
+
+def test_validate_email_checks_pattern_matches_with_email_validator():
+    assert not validate_email_(f"a@{'x' * 64}.com")
+
+
+def _parse_raw(raw: str):
+    return message_from_bytes(base64.urlsafe_b64decode(raw), policy=policy.default)
+
+
+def test_encode_raw_message_accepts_non_ascii_addresses():
+    raw = base64.urlsafe_b64decode(encode_raw_message("hi", sender="José <josé@example.com>", recipient="josé@example.com"))
+
+    # the addresses are written as UTF-8 (SMTPUTF8), since an addr-spec cannot be RFC 2047 encoded
+    assert "To: josé@example.com\r\n".encode("utf-8") in raw
+    assert "From: José <josé@example.com>\r\n".encode("utf-8") in raw
+    assert raw.endswith(b"\r\n\r\nhi")
+
+
+def test_encode_raw_message_uses_base64_for_long_lines():
+    body = "ż" * 600 + "\nshort line"
+    raw = base64.urlsafe_b64decode(encode_raw_message(body, recipient="a@example.com"))
+
+    assert b"Content-Transfer-Encoding: base64" in raw
+    assert all(len(line) <= 998 for line in raw.split(b"\r\n"))
+    assert _parse_raw(encode_raw_message(body)).get_content() == body
+
+
+def test_exec_callable_runs_only_listed_functions():
+    assert exec_callable("verify_limit", {"limit": 5}) == 5
+    for name in ("load_token", "save_token", "save_local_attachment", "file_exists", "setup_console_logger", "json"):
+        assert exec_callable(name, {}) is None, name
+
+
+def test_dump_json_bytes_fallback_matches_orjson(monkeypatch):
+    if utils.orjson is None:
+        pytest.skip("orjson is not installed")
+    payload = {"subject": "żółw", "labels": ["INBOX", "UNREAD"], "size": 12, "nested": {"empty": []}}
+    expected = dump_json_bytes(payload)
+
+    monkeypatch.setattr(utils, "orjson", None)
+
+    assert dump_json_bytes(payload) == expected
@@ -4,16 +4,33 @@ import os
 import re
 import json
 import uuid
-import pickle
 import base64
 import logging
 from pathlib import Path
+from functools import lru_cache
 from datetime import datetime
+from email.header import Header
+from email.policy import SMTPUTF8
+from email.utils import formataddr, getaddresses
 from termcolor import colored, COLORS
-from .compiled_regexes import EMAIL_ADDRESS
-from typing import Any, Final, List, Optional
-from .email_enumerators import AllowedAttachment
 from email_validator import validate_email, EmailNotValidError
+from .compiled_regexes import (
+    VALID_EMAIL,
+    EMAIL_ADDRESS,
+    HTTP_HTTPS_URL,
+    LINE_BREAK_RUN,
+    NON_TEXT_CHARS,
+    MESSAGE_NOISE,
+    INVISIBLE_SPACES,
+    CLEAN_TEXT_AND_URL,
+)
+from typing import Any, Callable, Final, List, Optional
+from .email_enumerators import AllowedAttachment
+
+try:
+    import orjson
+except ImportError:  # optional, falls back to the standard json module
+    orjson = None
 from .exceptions import ( 
     UtilsException,
     UtilsFileError,
@@ -33,6 +50,7 @@ Itincludes various utility functions for file handling, text formatting, email v
 
 
 LOGGER_NAME: Final[str] ="GmailPy"
+PACKAGE_DIR: Final[str] = Path(os.path.abspath(os.path.dirname(__file__))).as_posix()  # see abspath()
 
 MIME_TYPE_MAP = {
     "image/png": AllowedAttachment.PNG.value,
@@ -44,6 +62,20 @@ MIME_TYPE_MAP = {
     "application/xml": AllowedAttachment.XML.value,
     "text/xml": AllowedAttachment.XML.value,
 }
+ALLOWED_MIME_TYPES: Final[frozenset] = frozenset(MIME_TYPE_MAP)  # see is_attachment_allowed()
+ATTACHMENT_DECODE_CHUNK: Final[int] = 1024 * 1024  # base64 characters decoded at a time, a multiple of 4
+JSON_WRITE_BUFFER: Final[int] = 1024 * 1024  # bytes, see save_email()
+
+# log level names accepted by loglevel_mapping(), lowercase; 'exception' is logged at ERROR level
+LOG_LEVELS: Final[dict] = {
+    "debug": logging.DEBUG,
+    "info": logging.INFO,
+    "warn": logging.WARNING,
+    "warning": logging.WARNING,
+    "error": logging.ERROR,
+    "exception": logging.ERROR,
+    "critical": logging.CRITICAL,
+}
 
 
 def loglevel_mapping(log_level: str = None) -> int:
@@ -57,7 +89,8 @@ def loglevel_mapping(log_level: str = None) -> int:
     CRITICAL: Severe errors that cause a program to stop; requires immediate attention.
 
     Parameters:
-    log_level (str, optional): The log level string to be mapped. If not provided, the default log level is logging.INFO.
+    log_level (str, optional): The log level string to be mapped, case-insensitive (see LOG_LEVELS).
+                               If not provided, the default log level is logging.INFO.
 
     Returns:
     int: The corresponding logging level for the given log level string. If the log level string is not recognized,
@@ -67,22 +100,7 @@ def loglevel_mapping(log_level: str = None) -> int:
     if not log_level:
         return logging.INFO
 
-    log_level = log_level.lower()
-
-    if "debug" in log_level:
-        return logging.DEBUG
-    elif "info" in log_level:
-        return logging.INFO
-    elif "warn" in log_level:
-        return logging.WARNING
-    elif "error" in log_level:
-        return logging.ERROR
-    elif "critic" in log_level:
-        return logging.CRITICAL
-    elif "exc" in log_level:
-        return logging.EXCEPTION
-    else:
-        return logging.INFO
+    return LOG_LEVELS.get(log_level.strip().lower(), logging.INFO)
 
 
 
@@ -90,20 +108,28 @@ class ColorFormatter(logging.Formatter):
     """
     Custom logging formatter to add colors based on log level.
     """
-    
+
+    LEVEL_COLORS: Final[dict] = {
+        "DEBUG": "dark_grey",
+        "INFO": "light_green",
+        "WARNING": "light_yellow",
+        "ERROR": "blue",
+        "CRITICAL": "red",
+    }
+
+    def __init__(self, *args, **kwargs) -> None:
+        """
+        Initializes the formatter and colors every level name once, instead of for every record.
+
+        Parameters:
+        *args, **kwargs: Passed to logging.Formatter.
+        """
+
+        super().__init__(*args, **kwargs)
+        self._colored_levels = {level: color_message(level, color=color) for level, color in self.LEVEL_COLORS.items()}
+
     def format(self, record):
-        if record.levelname == 'DEBUG':
-            record.levelname = color_message(record.levelname, color='dark_grey')
-        elif record.levelname == 'INFO':
-            record.levelname = color_message(record.levelname, color='light_green')
-        elif record.levelname == 'WARNING':
-            record.levelname = color_message(record.levelname, color='light_yellow')
-        elif record.levelname == 'ERROR':
-            record.levelname = color_message(record.levelname, color='blue')
-        if record.levelname == 'CRITICAL':
-            record.levelname = color_message(record.levelname, color='red')
-        elif record.levelname == 'EXCEPTION':
-            record.levelname = color_message(record.levelname, color='red')
+        record.levelname = self._colored_levels.get(record.levelname, record.levelname)
         return super().format(record)
     
 
@@ -146,7 +172,8 @@ def null_logger():
     """
     Return a logger that does nothing (NullHandler) to prevent logging errors.
 
-    This function creates a logger with the name 'null_logger' and adds a NullHandler to it.
+    This function returns the logger named 'null_logger' and adds a NullHandler to it on first use only,
+    so repeated calls do not stack up handlers.
     The NullHandler does not perform any actions, which means it does not log any messages.
     This function is useful when you want to prevent logging errors or when you want to temporarily
     disable logging for a specific part of your code.
@@ -155,7 +182,8 @@ def null_logger():
     logging.Logger: A logger with a NullHandler added to it.
     """
     null_logger = logging.getLogger('null_logger')
-    null_logger.addHandler(logging.NullHandler())
+    if not null_logger.handlers:
+        null_logger.addHandler(logging.NullHandler())
     return null_logger
 
 
@@ -179,17 +207,14 @@ def file_exists(file: str, silent_error: bool = False) -> str:
     """
 
     try:
-        if not os.path.exists(file):
-            file = os.path.abspath(file)
-            if not os.path.exists(file):
-                if silent_error:
-                    return False
-                raise UtilsFileError(f"File '{file}' doesn't exist.")
+        # a single stat call; a relative path is resolved against the working directory by the OS itself
+        os.stat(file)
         return file
-    except (FileNotFoundError, FileExistsError) as e:
+    except (OSError, ValueError):
+        # any path os.path.exists() would report as missing
         if silent_error:
             return False
-        raise UtilsFileError(f"{e}")
+        raise UtilsFileError(f"File '{os.path.abspath(file)}' doesn't exist.")
     except Exception as e:
         if silent_error:
             return False
@@ -211,8 +236,7 @@ def remove_unicode(data: str, silent_error: bool = False) -> str:
     UtilsTextFormattingError: If silent_error is False inform about error during ASCII characters removal.
     """
     try:
-        cleaned_body = re.sub(r'[\u200c\u200b\xa0]+', '', data)
-        return re.sub(r'[^\w\s\u00C0-\u017F]', '', cleaned_body)
+        return NON_TEXT_CHARS.sub('', data)
     except re.error as e:
         if silent_error:
             return data
@@ -268,12 +292,139 @@ def color_message(message: str, color: str = "red", reverse_color: bool = True)
     if not isinstance(reverse_color, bool):
         reverse_color = DEFAULT_REVERSE
 
-    if color.lower().strip() not in list(COLORS.keys()):
+    color = color.lower().strip()
+    if color not in COLORS:
         color = DEFAULT_COLOR
 
+    return _colored_message(message, color, reverse_color)
+
+@lru_cache(maxsize=256)
+def _colored_message(message: str, color: str, reverse_color: bool) -> str:
+    """
+    Colors an already validated message (see color_message). The same few message-color pairs are colored over and over,
+    so the results are cached. Note that termcolor checks the terminal and the NO_COLOR / FORCE_COLOR variables only on a cache miss.
+
+    Parameters:
+    message (str): The message to be colored.
+    color (str): A termcolor color name.
+    reverse_color (bool): Whether to reverse the color.
+
+    Returns:
+    str: The colored message.
+    """
+
     if reverse_color:
-        return colored(f"{message}", f"{str(color)}", attrs=["reverse", "blink"])
-    return colored(f"{message}", f"{str(color)}", attrs=["blink"])
+        return colored(message, color, attrs=["reverse", "blink"])
+    return colored(message, color, attrs=["blink"])
+
+def dump_json_bytes(payload: Any) -> bytes:
+    """
+    Serializes a payload to indented JSON bytes, ready to be written to a binary file.
+    Uses orjson if it is installed and the standard json module otherwise.
+
+    Parameters:
+    payload (Any): The JSON-serializable data.
+
+    Returns:
+    bytes: The UTF-8 encoded JSON document.
+
+    Raises:
+    TypeError: If the payload is not JSON-serializable.
+    """
+
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    # same layout as orjson (2-space indent, raw UTF-8), so the saved files do not depend on the backend
+    return json.dumps(payload, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def dump_json_line(payload: Any) -> bytes:
+    """
+    Serializes a payload to a single line of compact JSON bytes, terminated by a newline (NDJSON).
+    Uses orjson if it is installed and the standard json module otherwise.
+
+    Parameters:
+    payload (Any): The JSON-serializable data.
+
+    Returns:
+    bytes: The UTF-8 encoded JSON line, including the trailing newline.
+
+    Raises:
+    TypeError: If the payload is not JSON-serializable.
+    """
+
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(payload, separators=(",", ":")).encode("utf-8") + b"\n"
+
+
+_RAW_MESSAGE_HEAD: Final[bytes] = b"MIME-Version: 1.0\r\nContent-Type: text/plain; charset=utf-8\r\nContent-Transfer-Encoding: 8bit\r\n"
+_RAW_MESSAGE_HEAD_BASE64: Final[bytes] = b"MIME-Version: 1.0\r\nContent-Type: text/plain; charset=utf-8\r\nContent-Transfer-Encoding: base64\r\n"
+# RFC 5322 line length limit (without CRLF); an 8bit body with a longer line is sent as base64 instead
+MAX_LINE_OCTETS: Final[int] = 998
+
+
+def _encode_header(name: bytes, value: str, addresses: bool = False) -> bytes:
+    """
+    Encodes a single message header line. Line breaks in the value are replaced with spaces,
+    so a value cannot inject additional headers; non-ASCII values are RFC 2047 encoded. A non-ASCII address
+    cannot be RFC 2047 encoded, so an address list containing one is written as UTF-8 (SMTPUTF8) instead.
+
+    Parameters:
+    name (bytes): The header name, e.g. b"To".
+    value (str): The header value.
+    addresses (bool): If True, the value is a list of addresses and only the display names are encoded.
+
+    Returns:
+    bytes: The header line, terminated by CRLF.
+    """
+
+    value = value.replace("\r", " ").replace("\n", " ")
+    if value.isascii():
+        encoded = value.encode("ascii")
+    elif addresses:
+        parsed = getaddresses([value])
+        if not all(address.isascii() for _, address in parsed):
+            return SMTPUTF8.header_factory(name.decode("ascii"), value).fold(policy=SMTPUTF8).encode("utf-8")
+        encoded = ", ".join(formataddr(address, charset="utf-8") for address in parsed).encode("ascii")
+    else:
+        encoded = Header(value, "utf-8").encode().encode("ascii")
+    return name + b": " + encoded + b"\r\n"
+
+
+def encode_raw_message(body: str, sender: Optional[str] = None, recipient: Optional[str] = None, subject: Optional[str] = None) -> str:
+    """
+    Builds a plain text RFC 5322 message and encodes it as the base64url 'raw' value expected by the Gmail API.
+    The message bytes are joined directly instead of being rendered by the email package generator.
+
+    Parameters:
+    body (str): The message body, sent as UTF-8 text (8bit, or base64 if a line is longer than MAX_LINE_OCTETS).
+    sender (Optional[str]): The 'From' header. Omitted if None.
+    recipient (Optional[str]): The 'To' header. Omitted if None.
+    subject (Optional[str]): The 'Subject' header. Omitted if None.
+
+    Returns:
+    str: The base64url encoded message.
+    """
+
+    parts = []
+    if recipient is not None:
+        parts.append(_encode_header(b"To", recipient, addresses=True))
+    if sender is not None:
+        parts.append(_encode_header(b"From", sender, addresses=True))
+    if subject is not None:
+        parts.append(_encode_header(b"Subject", subject))
+    encoded_body = body.encode("utf-8")
+    if len(encoded_body) > MAX_LINE_OCTETS and any(len(line) > MAX_LINE_OCTETS for line in encoded_body.splitlines()):
+        parts.append(_RAW_MESSAGE_HEAD_BASE64)
+        parts.append(b"\r\n")
+        parts.append(base64.encodebytes(encoded_body).replace(b"\n", b"\r\n"))
+    else:
+        parts.append(_RAW_MESSAGE_HEAD)
+        parts.append(b"\r\n")
+        parts.append(encoded_body)
+    return base64.urlsafe_b64encode(b"".join(parts)).decode("ascii")
+
 
 def save_email(file_path: str, file_name: str, payload: dict, silent_error: bool = False) -> bool | None:
     """
@@ -284,6 +435,7 @@ def save_email(file_path: str, file_name: str, payload: dict, silent_error: bool
     file_path (str): The directory path where the JSON file will be saved.
     file_name (str): The base name of the JSON file. The UUID and timestamp will be appended to this name.
     payload (dict): The data to be saved as a JSON file. If the payload is a string, it will be parsed as JSON.
+                    If it is bytes, it is treated as an already serialized JSON document and written as is.
     silent_error (bool): If True, the function will return False instead of raising an exception if an error occurs.
         Defaults to False.
 
@@ -308,15 +460,16 @@ def save_email(file_path: str, file_name: str, payload: dict, silent_error: bool
         if isinstance(payload, str):
             payload = json.loads(payload)
 
-        timestamp = (
-            str(datetime.now().replace(microsecond=0))
-            .replace(":", "")
-            .replace("-", "")
-            .replace(" ", "")
-        )
+        file_path = f"{file_path}/{file_name}_{uuid.uuid4().hex}_{generate_timestamp()}.json"
 
-        with open(f"{file_path}/{file_name}_{uuid.uuid4().hex}_{timestamp}.json", "a+") as file:
-            file.write(json.dumps(payload, indent=4))
+        if isinstance(payload, bytes) or orjson is not None:
+            with open(file_path, "wb") as file:
+                file.write(payload if isinstance(payload, bytes) else dump_json_bytes(payload))
+        else:
+            # without orjson, the document is streamed to the file instead of being built as one string first;
+            # json.dump() writes many small pieces, so a larger buffer turns them into few system calls
+            with open(file_path, "w", encoding="utf-8", buffering=JSON_WRITE_BUFFER) as file:
+                json.dump(payload, file, indent=2, ensure_ascii=False)
 
     except (UtilsFileError, UtilsException, Exception) as e:
         if silent_error:
@@ -325,7 +478,7 @@ def save_email(file_path: str, file_name: str, payload: dict, silent_error: bool
 
 def save_token(token_file: str, credentials: dict) -> None:
     """
-    Save and serialize a token to a file using pickle.
+    Save and serialize a token to a file as JSON.
 
     Parameters:
     token_file (str): The path to the file where the token will be saved.
@@ -344,14 +497,15 @@ def save_token(token_file: str, credentials: dict) -> None:
     non_empty_string(token_file)
 
     try:
+        payload = dump_json_line(credentials)
         with open(token_file, "wb") as file:
-            pickle.dump(credentials, file)
+            file.write(payload)
 
-    except (UtilsFileError, UtilsException) as e:
+    except (OSError, UtilsFileError, UtilsException) as e:
         raise TokenFileOpenException(
             f"The token file '{token_file}' could not be opened: {e}"
         )
-    except pickle.PickleError as e:
+    except (TypeError, ValueError) as e:
         raise TokenSerializationException(
             f"An error occurred while serializing the token: {e}"
         )
@@ -359,28 +513,44 @@ def save_token(token_file: str, credentials: dict) -> None:
 
 def load_token(token_file: str) -> dict|None:
     """
-    Load and deserialize a token from a file using pickle.
+    Load and deserialize a token from a file. The file is read with a single open() call, without checking first
+    if it exists. Tokens are stored as JSON; pickled tokens saved by earlier versions are still read.
 
     Parameters:
     token_file (str): The path to the file containing the token.
 
     Returns:
-    dict: The deserialized token.
+    dict: The deserialized token, or the unpickled object for a token saved by an earlier version.
+    None: If the token file does not exist yet.
 
     Raises:
     TokenFileOpenException: If the token file could not be opened.
     TokenSerializationException: If an error occurred while deserializing the token.
     """
     try:
-
-        token_file = file_exists(token_file)
-
         with open(token_file, "rb") as file:
-            return pickle.load(file)
-        
-    except (UtilsFileError, UtilsException):
+            data = file.read()
+    except FileNotFoundError:
         return None # file might not exist yet
-    except pickle.PickleError as e:
+    except OSError as e:
+        raise TokenFileOpenException(
+            f"The token file '{token_file}' could not be opened: {e}"
+        )
+
+    if data.lstrip()[:1] == b"{":
+        try:
+            return orjson.loads(data) if orjson is not None else json.loads(data)
+        except ValueError as e:
+            raise TokenSerializationException(
+                f"An error occurred while deserializing the token: {e}"
+            )
+
+    # only tokens saved by earlier versions are pickled, so pickle is not imported for the others
+    import pickle
+
+    try:
+        return pickle.loads(data)
+    except (ValueError, EOFError, pickle.PickleError) as e:
         raise TokenSerializationException(
             f"An error occurred while deserializing the token: {e}"
         )
@@ -405,15 +575,36 @@ def extract_email_address(email_headers: str) -> list:
     """
 
     non_empty_string(email_headers)
-    return re.findall(EMAIL_ADDRESS, email_headers)
+    return EMAIL_ADDRESS.findall(email_headers)
+
+
+_is_valid_email = VALID_EMAIL.fullmatch
+
+
+def _passes_email_validator(email: str) -> bool:
+    """
+    Checks a single email address with the `email_validator` library, without DNS or deliverability lookups.
+
+    Parameters:
+    email (str): The email address to be validated.
+
+    Returns:
+    bool: True if `email_validator` accepts the address, False otherwise.
+    """
+    try:
+        validate_email(email, check_deliverability=False)
+        return True
+    except EmailNotValidError:
+        return False
 
 
 def validate_email_(email: str) -> bool:
     """
     Validates if a given email address is valid or not.
 
-    This function uses the `validate_email` function from the `email_validator` library to validate the email address.
-    It checks if the email address is not empty and if it is a valid email address according to the email validation rules.
+    This function checks that the email address is not empty and matches the precompiled VALID_EMAIL pattern, which
+    rejects malformed addresses cheaply. A matching address is then validated with the `validate_email` function
+    from the `email_validator` library. No DNS or deliverability lookups are made.
 
     Parameters:
     email (str): The email address to be validated.
@@ -427,22 +618,22 @@ def validate_email_(email: str) -> bool:
     """
 
     non_empty_string(email)
-
-    try:
-        validate_email(email)
-        return True
-    except EmailNotValidError:
+    if _is_valid_email(email) is None:
         return False
+    return _passes_email_validator(email)
 
 
-def validate_bulk_emails(emails: List[str], skip_invalid_emails: bool = True) -> List[str] |  None:
+def validate_bulk_emails(emails: List[str], skip_invalid_emails: bool = True, strict: bool = False) -> List[str] |  None:
     """
-    Validates a list of email addresses using the `validate_email` function.
+    Validates a list of email addresses against the precompiled VALID_EMAIL pattern. With `strict`, the addresses
+    that match are also checked with the `validate_email` function (see validate_email_).
 
     Parameters:
     - emails (List[str]): A list of email addresses to be validated.
     - skip_invalid_emails (bool): If True, only valid emails will be returned. If False, an exception will be raised
       for invalid emails. Defaults to True.
+    - strict (bool): If True, the addresses that pass the pattern are also checked with `email_validator`, which is
+      slower but catches what a pattern cannot (e.g. label and address lengths). Defaults to False.
 
     Returns:
     - List[str]: A list of valid email addresses if `skip_invalid_emails` is True.
@@ -455,19 +646,15 @@ def validate_bulk_emails(emails: List[str], skip_invalid_emails: bool = True) ->
     if not emails:
         return []
 
-    valid_emails, invalid_emails = [], []
-
-    for email in emails:
-        try:
-            validate_email(email)
-            valid_emails.append(email)
-        except Exception:
-            invalid_emails.append(email)
+    # non-str items count as invalid
+    valid_emails = [email for email in emails if type(email) is str and _is_valid_email(email)]
+    if strict:
+        valid_emails = [email for email in valid_emails if _passes_email_validator(email)]
 
-    if invalid_emails:
+    if len(valid_emails) != len(emails):
         if skip_invalid_emails:
             return valid_emails
-        raise UtilsEmailError(f"Found {len(invalid_emails)} invalid email(s).")
+        raise UtilsEmailError(f"Found {len(emails) - len(valid_emails)} invalid email(s).")
 
     return valid_emails if skip_invalid_emails else None
 
@@ -493,25 +680,89 @@ def clean_text(text: str) -> str:
         raise TypeError(f"Input for clearing Unicode must be a string, but received '{type(text).__name__}' instead.")
     
     try:
-        cleaned_text = re.sub(r'(\r\n|\n|\r){2,}', '\n', text)
-        cleaned_text = re.sub(r'[\u2000-\u200F\u2028\u2029\u202A-\u202F]', '', cleaned_text)
+        cleaned_text = LINE_BREAK_RUN.sub('\n', text)
+        cleaned_text = INVISIBLE_SPACES.sub('', cleaned_text)
         return cleaned_text.strip()
     except Exception as e:
         raise UtilsTextFormattingError(f"{e}")
 
 
+def clean_message(text: str) -> str:
+    """
+    This function cleans an email message text: it does what remove_unicode() followed by clean_text() does,
+    in two regex passes instead of three and without the intermediate checks.
+
+    Parameters:
+    text (str): The message text to be cleaned.
+
+    Returns:
+    str: The cleaned message text.
+
+    Raises:
+    UtilsTextFormattingError: If an error occurs during the cleaning process.
+    """
+
+    if not text:
+        return text
+
+    try:
+        return LINE_BREAK_RUN.sub('\n', MESSAGE_NOISE.sub('', text)).strip()
+    except Exception as e:
+        raise UtilsTextFormattingError(f"{e}")
+
+
+def clean_text_and_strip_urls(text: str, sink: Optional[Callable[[str], Any]] = None) -> str:
+    """
+    This function removes links from a given text and cleans it the same way as clean_text(), in a single regex pass.
+
+    Parameters:
+    text (str): The input text to be cleaned.
+    sink (Optional[Callable[[str], Any]]): Called with every removed link, e.g. list.append to collect them. Optional.
+
+    Returns:
+    str: The cleaned text with links and the clean_text() patterns removed.
+
+    Raises:
+    UtilsTextFormattingError: If an error occurs during the cleaning process.
+    """
+
+    if not text:
+        return text
+
+    if not isinstance(text, str):
+        raise TypeError(f"Input for clearing Unicode must be a string, but received '{type(text).__name__}' instead.")
+
+    def _replace(match: re.Match) -> str:
+        kind = match.lastgroup
+        if kind == "url":
+            if sink is not None:
+                sink(match.group())
+            return ""
+        if kind == "newlines":
+            if sink is not None:
+                for url in HTTP_HTTPS_URL.findall(match.group()):
+                    sink(url)
+            return "\n"
+        return ""
+
+    try:
+        return CLEAN_TEXT_AND_URL.sub(_replace, text).strip()
+    except Exception as e:
+        raise UtilsTextFormattingError(f"{e}")
+
+
 def exec_callable(name: str, arguments: Optional[dict] = {}) -> None:
     """
     This function executes a callable object with the given name and arguments.
 
     Note:
-    This function uses the globals().get() method to retrieve the callable object by its name. It then checks if the retrieved
-    object is callable using the callable() function. If both conditions are met, the function will execute the callable object
-    with the provided arguments using the **arguments syntax. If an error occurs during execution, the function will catch the
-    exception and return a dictionary with an "Error" key containing a message indicating the unknown function.
+    This function looks the callable object up by its name in _CALLABLES, a fixed table of the text, validation and
+    email helpers of this module. Other names (e.g. 'json', 'load_token' or 'save_token') are not reachable. If the name is found,
+    the function will execute the callable object with the provided arguments using the **arguments syntax.
+    An unknown name returns None.
 
     Parameters:
-    name (str): The name of the callable object to be executed. The function will search for this name in the global scope.
+    name (str): The name of the callable object to be executed, one of the keys of _CALLABLES.
     arguments (Optional[dict]): A dictionary containing the arguments to be passed to the callable object. Optional.
 
     Returns:
@@ -524,8 +775,8 @@ def exec_callable(name: str, arguments: Optional[dict] = {}) -> None:
     non_empty_string(name)
     
     try:
-        func = globals().get(name)
-        if callable(func):
+        func = _CALLABLES.get(name)
+        if func is not None:
             return func(**arguments)
     except (NameError, TypeError) as e:
         raise UtilsCallableError(f"{e}")
@@ -545,11 +796,8 @@ def abspath(file: str = None) -> Path:
         the function will return the absolute path of the current script's directory.
     """
     if not file:
-        return Path(os.path.abspath(os.path.join(os.path.dirname(__file__)))).as_posix()
-    return (
-        Path(os.path.abspath(os.path.join(os.path.dirname(__file__)))).as_posix()
-        + "/" + Path(f"{file}").as_posix()
-    )
+        return PACKAGE_DIR
+    return PACKAGE_DIR + "/" + Path(f"{file}").as_posix()
 
 
 def verify_limit(limit: int|None) -> None|int:
@@ -600,7 +848,7 @@ def indent(data: dict) -> str:
 
 
 def generate_timestamp() -> str:
-    return str(datetime.now().replace(microsecond=0)).replace(":","").replace(" ","").replace("-","")
+    return datetime.now().strftime("%Y%m%d%H%M%S")
 
 
 def save_local_attachment(file_path: str, part: Any, attachment_data: Any, mime_type: str, silent_error: bool = False) -> bool:
@@ -620,17 +868,16 @@ def save_local_attachment(file_path: str, part: Any, attachment_data: Any, mime_
     UtilsFileError: If silent_error=False, when error occurs while saving the attachment.
     """
     try:
-        file_path = f"{file_path}/{part['filename'].split(".")[-1]}"
+        file_path = f"{file_path}/{part['filename'].rsplit('.', 1)[-1]}"
+        # no separate existence check, so there is no race with another thread creating the same directory
+        os.makedirs(file_path, mode=0o755, exist_ok=True)
 
-        if not os.path.exists(file_path):
-            file_path = abspath(file_path)
-            if not os.path.exists(file_path):
-                os.makedirs(file_path, mode=0o755)
-        
         file_path = os.path.join(file_path, f"{generate_timestamp()}_{part['filename']}")
         
         with open(file_path, "wb") as f:
-            f.write(base64.urlsafe_b64decode(attachment_data))
+            # decoded chunk by chunk, so a large attachment is not held as both base64 text and decoded bytes
+            for start in range(0, len(attachment_data), ATTACHMENT_DECODE_CHUNK):
+                f.write(base64.urlsafe_b64decode(attachment_data[start:start + ATTACHMENT_DECODE_CHUNK]))
         return True
     except Exception as e:
         if silent_error:
@@ -638,13 +885,14 @@ def save_local_attachment(file_path: str, part: Any, attachment_data: Any, mime_
         raise UtilsFileError(f"Failed to locally save attachment(s): {e}")
 
 
+@lru_cache(maxsize=128)
 def is_attachment_allowed(mime_type: str) -> bool:
     """
     Check if the MIME type is allowed based on predefined rules.
+    The same few MIME types repeat across a mailbox, so the results are cached per raw 'mime_type' value.
 
     Parameters:
     mime_type (str): The MIME type of the attachment.
-    part (Any): The email part containing the attachment information.
 
     Returns:
     bool: True if the MIME type is allowed, False otherwise.
@@ -653,16 +901,29 @@ def is_attachment_allowed(mime_type: str) -> bool:
     None
     """
 
-    try:
-        mime_type = mime_type.split(';')[0].strip()
-
-        if not mime_type:
-            return False
-
-        file_extension = MIME_TYPE_MAP.get(mime_type)
-        if file_extension:
-            return True
-        return False
-    except IndexError:
-        # if mime_type not available or not recognizable, skip it
+    # if mime_type not available or not recognizable, skip it
+    if not mime_type or not isinstance(mime_type, str):
         return False
+
+    return mime_type.split(';', 1)[0].strip() in ALLOWED_MIME_TYPES
+
+
+# the closed set of functions exec_callable() can run; a new function is reachable only if it is added here.
+# token, file system and logger setup helpers are left out on purpose (load_token still unpickles legacy files)
+_CALLABLES: Final[dict] = {
+    "clean_message": clean_message,
+    "clean_text": clean_text,
+    "clean_text_and_strip_urls": clean_text_and_strip_urls,
+    "color_message": color_message,
+    "extract_email_address": extract_email_address,
+    "generate_timestamp": generate_timestamp,
+    "indent": indent,
+    "is_attachment_allowed": is_attachment_allowed,
+    "loglevel_mapping": loglevel_mapping,
+    "remove_unicode": remove_unicode,
+    "save_email": save_email,
+    "show_message_colors": show_message_colors,
+    "validate_bulk_emails": validate_bulk_emails,
+    "validate_email_": validate_email_,
+    "verify_limit": verify_limit,
+}